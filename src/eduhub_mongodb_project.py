@@ -5,13 +5,67 @@
 
 
 # This is used to connect to a MongoDB database server
-from pymongo import MongoClient
-from datetime import datetime, timedelta
+from pymongo import MongoClient, ReturnDocument, IndexModel, WriteConcern, InsertOne, UpdateMany
+from pymongo.collation import Collation
+from pymongo.errors import BulkWriteError
+import bson
+from bson import ObjectId
+from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from threading import Lock
+import calendar
+import mmap
+import os
+import re
 import time
 import json
 
+# orjson parses JSON faster than the standard library; it is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Documents are encoded to BSON by PyMongo's C extension; without it the
+# pure Python encoder is used, which is much slower for bulk inserts
+if not bson.has_c():
+    print("Warning: bson C extension not available, using the pure Python encoder")
+
 # Create a connection to the local MongoDB server running on the default port 27017
-client = MongoClient("mongodb://localhost:27017/")
+# A single client is created per process (get_client) and reused for the whole
+# script; its pool keeps 10 warm connections ready for concurrent operations
+# (the script runs at most 8 at once, when creating the indexes) and opens
+# at most 100; it waits at most 2.5 s for a free connection instead of
+# blocking forever, writes are retried once on transient errors and messages are compressed on
+# the wire (zstd/snappy when their modules are installed, otherwise zlib
+# from the standard library)
+MONGO_URI = "mongodb://localhost:27017/"
+
+
+@lru_cache(maxsize=None)
+def get_client(uri=MONGO_URI):
+    """
+    Return the MongoClient of the given server, created on the first call.
+    """
+    return MongoClient(
+        uri,
+        maxPoolSize=100,
+        minPoolSize=10,
+        waitQueueTimeoutMS=2500,
+        retryWrites=True,
+        compressors="zstd,snappy,zlib",
+        zlibCompressionLevel=6,
+        w=1
+    )
+
+
+client = get_client()
 
 # Access or create if it doesn’t exist the database named 'eduhub_db'
 db = client["eduhub_db"]
@@ -27,35 +81,68 @@ db = client["eduhub_db"]
 # and creating collections with schema validation.
 
 
-def get_next_id(db, collection_name, id_field):
+@lru_cache(maxsize=32)
+def get_collection(db, collection_name):
+    """
+    Return the Collection object for a collection name.
+
+    Handles are cached per (database, name), so helpers called in a loop
+    reuse the same object instead of building a new one on every call.
+
+    Parameters:
+        db (Database): The MongoDB database object.
+        collection_name (str): Name of the collection.
+
+    Returns:
+        Collection: The collection handle.
+    """
+    return db[collection_name]
+
+
+#number of IDs reserved at a time by get_next_id, and the IDs reserved but
+#not handed out yet per collection: collection name -> [next ID, last ID]
+ID_BLOCK_SIZE = 50
+_id_blocks = {}
+_id_blocks_lock = Lock()
+
+
+def get_next_id(db, collection_name):
     """
     Generate the next available ID for a given MongoDB collection.
 
-    This function retrieves the document with the highest ID value
-    and returns that value + 1. If the collection is empty, it returns 1.
+    IDs are taken from a per-collection sequence stored in the 'counters'
+    collection. The sequence is incremented atomically on the server by
+    ID_BLOCK_SIZE at a time, reserving a block of IDs that this process
+    then hands out without contacting the server again. Concurrent writers
+    never receive the same ID; IDs left in a block when the script ends
+    are simply not used.
 
     Parameters:
         db (Database): The MongoDB database object.
         collection_name (str): Name of the collection.
-        id_field (str): Field name used as the ID.
 
     Returns:
         int: The next available ID.
         None: If an exception occurs.
     """
     try:
-        # Access the specified collection
-        collection = db[collection_name]
-
-        # Find the document with the highest ID (descending order)
-        last_doc = collection.find_one(sort=[(id_field, -1)])
-
-        # If a document exists and contains the ID field, increment by 1
-        if last_doc and id_field in last_doc:
-            return last_doc[id_field] + 1
-
-        # Otherwise, return 1 as the first ID
-        return 1
+        with _id_blocks_lock:
+            block = _id_blocks.get(collection_name)
+
+            # Reserve a new block when none is left, in one round trip
+            if block is None or block[0] > block[1]:
+                counter = db["counters"].find_one_and_update(
+                    {"_id": collection_name},
+                    {"$inc": {"seq": ID_BLOCK_SIZE}},
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                    projection={"seq": 1}
+                )
+                block = _id_blocks[collection_name] = [counter["seq"] - ID_BLOCK_SIZE + 1, counter["seq"]]
+
+            next_id = block[0]
+            block[0] += 1
+            return next_id
 
     except Exception as e:
         # Print error message and return None if any error occurs
@@ -63,10 +150,86 @@ def get_next_id(db, collection_name, id_field):
         return None
 
 
+def sync_counter(db, collection_name, id_field, documents):
+    """
+    Move the sequence of a collection past the IDs of documents inserted
+    with explicit IDs (e.g. the sample data), so that get_next_id()
+    continues after them.
+
+    The highest ID is taken from the given documents rather than read back
+    from the collection: the sample data is inserted without
+    acknowledgement, so a query sent right after it (possibly on another
+    connection of the pool) is not guaranteed to see those documents.
+
+    Parameters:
+        db (Database): The MongoDB database object.
+        collection_name (str): Name of the collection.
+        id_field (str): Field name used as the ID.
+        documents (list): The inserted documents.
+
+    Returns:
+        bool: True if the counter is synchronized.
+              False if an exception occurs.
+    """
+    try:
+        # Highest ID among the inserted documents
+        last_id = max((document[id_field] for document in documents if id_field in document), default=None)
+
+        # Only move the sequence forward, never backwards
+        if last_id is not None:
+            db["counters"].update_one(
+                {"_id": collection_name},
+                {"$max": {"seq": last_id}},
+                upsert=True
+            )
+            # A block reserved before may overlap the inserted IDs, reserve a new one
+            with _id_blocks_lock:
+                _id_blocks.pop(collection_name, None)
+        return True
+
+    except Exception as e:
+        # Print error message and return False if any error occurs
+        print(f"Error while synchronizing counter: {e}")
+        return False
+
+
+def months_ago(months, now=None):
+    """
+    Return the date a number of calendar months before now.
+
+    The day of the month is kept, or moved back to the last day of the
+    target month when that month is shorter (e.g. 31 August -> 28 February).
+
+    Parameters:
+        months (int): Number of months to go back.
+        now (datetime): Reference date, the current UTC time by default.
+
+    Returns:
+        datetime: The date months calendar months before now.
+    """
+    now = now or datetime.now(timezone.utc)
+    month_index = now.year * 12 + now.month - 1 - months
+    year, month = divmod(month_index, 12)
+    month += 1
+    day = min(now.day, calendar.monthrange(year, month)[1])
+    return now.replace(year=year, month=month, day=day)
+
+
+@lru_cache(maxsize=None)
+def _read_file_bytes(file_path):
+    # Raw content of a file, read from disk only once
+    return Path(file_path).read_bytes()
+
+
 def load_json_file(file_path):
     """
     Load and parse data from a JSON file.
 
+    The file content is cached, so loading the same file again does not
+    read it a second time. It is parsed on every call, so each caller gets
+    its own copy of the data and can modify it safely. Uses orjson when it
+    is installed.
+
     Parameters:
         file_path (str): Path to the JSON file.
 
@@ -75,11 +238,13 @@ def load_json_file(file_path):
         None: If the file is not found or an error occurs.
     """
     try:
-        # Open the file in read mode
-        with open(file_path, "r") as file:
-            # Load and parse the JSON data
-            data = json.load(file)
-        return data
+        # Read the whole file at once (cached)
+        content = _read_file_bytes(file_path)
+
+        # Parse the JSON data
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
 
     except FileNotFoundError:
         # Print message if the file does not exist
@@ -87,6 +252,95 @@ def load_json_file(file_path):
         return None
 
 
+def save_bson_file(file_path, documents):
+    """
+    Write documents to a BSON file, one encoded document after another
+    (the same layout as the .bson files produced by mongodump).
+
+    Parameters:
+        file_path (str): Path to the BSON file.
+        documents (list): Documents to write.
+
+    Returns:
+        bool: True if the file is written successfully.
+              False if an exception occurs.
+    """
+    try:
+        with open(file_path, "wb") as file:
+            file.write(b"".join(bson.encode(document) for document in documents))
+        return True
+
+    except Exception as e:
+        # Print error message if writing fails
+        print(f"Error writing BSON file '{file_path}': {e}")
+        return False
+
+
+def load_bson_file(file_path):
+    """
+    Load all documents stored in a BSON file.
+
+    The file is memory-mapped and decoded in one call, so its pages are
+    read straight from the OS cache (and shared between processes loading
+    the same file).
+
+    Parameters:
+        file_path (str): Path to the BSON file.
+
+    Returns:
+        list: Decoded documents if successful.
+        None: If the file is not found.
+    """
+    try:
+        with open(file_path, "rb") as file:
+            # An empty file cannot be mapped and holds no documents
+            if os.fstat(file.fileno()).st_size == 0:
+                return []
+
+            # Documents are decoded by the BSON C extension directly from the mapped file
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                return bson.decode_all(mapped_file)
+
+    except FileNotFoundError:
+        return None
+
+
+def load_seed_documents(collection_name, data_name):
+    """
+    Get the sample documents of a collection.
+
+    The documents are read from 'eduhub_db.<collection>.bson' when that file
+    exists and is newer than eduhub_seed_data.py (the files can be
+    generated ahead of time by running eduhub_seed_data.py). Otherwise the
+    list is taken from the eduhub_seed_data module (imported only at that
+    point) and saved to that file, so later runs can load them from BSON;
+    a file older than the module is regenerated, so edits to the sample
+    data are never ignored.
+
+    Parameters:
+        collection_name (str): Name of the collection.
+        data_name (str): Name of the list in eduhub_seed_data, e.g. "users_data".
+
+    Returns:
+        list: Documents to insert into the collection.
+    """
+    file_path = f"eduhub_db.{collection_name}.bson"
+
+    # Only use the file if it was written after the last change of the module
+    # (the module is located without importing it)
+    module_path = find_spec("eduhub_seed_data").origin
+    if os.path.exists(file_path) and os.path.getmtime(file_path) >= os.path.getmtime(module_path):
+        cached_documents = load_bson_file(file_path)
+        if cached_documents is not None:
+            return cached_documents
+
+    # The module's sample data is read-only, so the documents to insert are
+    # copies (the driver adds an _id field to each inserted document)
+    documents = getattr(import_module("eduhub_seed_data"), data_name)
+    save_bson_file(file_path, documents)
+    return [dict(document) for document in documents]
+
+
 def create_collection_with_schema(db, collection_name, schema):
     """
     Create a MongoDB collection with a specified JSON schema validator.
@@ -118,6 +372,117 @@ def create_collection_with_schema(db, collection_name, schema):
         return False
 
 
+# Python types accepted for each BSON type used in the schemas
+BSON_TYPES = {
+    "object": (Mapping,),
+    "array": (list, tuple),
+    "string": (str,),
+    "int": (int,),
+    "double": (float,),
+    "bool": (bool,),
+    "date": (datetime,),
+    "objectId": (ObjectId,),
+    "null": (type(None),),
+}
+
+
+def compile_schema(schema):
+    """
+    Compile a MongoDB $jsonSchema document into a Python validation function.
+
+    The schema tree is walked once here; the returned function only runs the
+    prepared checks, so many documents can be validated without
+    re-interpreting the schema each time. Supports the keywords used by the
+    project schemas: bsonType, required, properties, additionalProperties,
+    enum and items.
+
+    Parameters:
+        schema (dict): JSON schema used for the collection validator.
+
+    Returns:
+        function: Takes a document and returns a list of error messages
+                  (empty if the document is valid).
+    """
+    check = _compile_checks(schema)
+
+    def validate(document):
+        errors = []
+        check(document, "document", errors)
+        return errors
+
+    return validate
+
+
+def _compile_checks(schema):
+    """
+    Build the check function of one schema node (see compile_schema).
+
+    A check function takes (value, path, errors) and appends a message
+    to errors for every violation found in value.
+    """
+    checks = []
+
+    # Type check ('bool' is a subclass of 'int', so it is excluded explicitly)
+    if "bsonType" in schema:
+        bson_types = schema["bsonType"]
+        if isinstance(bson_types, str):
+            bson_types = [bson_types]
+        allowed = tuple(python_type for name in bson_types for python_type in BSON_TYPES[name])
+        allows_bool = "bool" in bson_types
+
+        def check_type(value, path, errors):
+            if not isinstance(value, allowed) or (isinstance(value, bool) and not allows_bool):
+                errors.append(f"{path}: expected {'/'.join(bson_types)}")
+                return False
+            return True
+        checks.append(check_type)
+
+    if "enum" in schema:
+        enum_values = schema["enum"]
+
+        def check_enum(value, path, errors):
+            if value not in enum_values:
+                errors.append(f"{path}: {value!r} is not one of {enum_values}")
+            return True
+        checks.append(check_enum)
+
+    if "required" in schema or "properties" in schema:
+        required = schema.get("required", [])
+        properties = {name: _compile_checks(sub) for name, sub in schema.get("properties", {}).items()}
+        closed = schema.get("additionalProperties", True) is False
+
+        def check_fields(value, path, errors):
+            if isinstance(value, Mapping):
+                for name in required:
+                    if name not in value:
+                        errors.append(f"{path}.{name}: required field is missing")
+                for name, field_value in value.items():
+                    if name in properties:
+                        properties[name](field_value, f"{path}.{name}", errors)
+                    elif closed:
+                        errors.append(f"{path}.{name}: additional field is not allowed")
+            return True
+        checks.append(check_fields)
+
+    if "items" in schema:
+        check_item = _compile_checks(schema["items"])
+
+        def check_items(value, path, errors):
+            if isinstance(value, (list, tuple)):
+                for index, item in enumerate(value):
+                    check_item(item, f"{path}[{index}]", errors)
+            return True
+        checks.append(check_items)
+
+    def check(value, path, errors):
+        # Stop at the first failing check (e.g. no field checks on a wrong type)
+        for run_check in checks:
+            if not run_check(value, path, errors):
+                break
+
+    return check
+
+
 # In[165]:
 
 
@@ -128,29 +493,77 @@ def create_collection_with_schema(db, collection_name, schema):
 #and returns a meaningful result.
 
 
-def read_document(db, collection_name, filter_query):
+def read_document(db, collection_name, filter_query, projection=None, batch_size=1000,
+                  sort=None, limit=0, hint=None, collation=None):
     """
     Read (find) documents that match a given filter.
 
+    The documents are streamed from the server in batches while the caller
+    iterates, instead of being loaded into memory all at once.
+
+    Parameters:
+        projection (dict): Optional fields to include or exclude.
+        batch_size (int): Optional number of documents per network batch
+                          (1000 by default, 0 lets the server decide, which
+                          means 101 documents for the first batch).
+        sort (list): Optional list of (field, direction) pairs.
+        limit (int): Optional maximum number of documents (0 means no limit).
+        hint (str or list): Optional index name or key pattern to use.
+        collation (Collation): Optional collation for string comparisons.
+
     Returns:
-        list: List of matching documents.
-              Returns an empty list if no results or an error occurs.
+        Cursor: Iterable over the matching documents.
+                Returns an empty list if an error occurs.
     """
     try:
         # Access the target collection
-        collection = db[collection_name]
-
-        # Execute the query to find all matching documents
-        result = collection.find(filter_query)
-
-        # Convert the cursor result to a list of documents
-        return list(result)
+        collection = get_collection(db, collection_name)
+
+        # Return the cursor so documents are fetched lazily, batch by batch
+        cursor = collection.find(filter_query, projection, batch_size=batch_size, collation=collation)
+
+        # Apply the optional cursor modifiers
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+        if hint:
+            cursor = cursor.hint(hint)
+        return cursor
     except Exception as e:
         # Print error and return an empty list on failure
         print(f"Error reading documents: {e}")
         return []
 
 
+def run_aggregations(db, aggregations):
+    """
+    Run several aggregation pipelines concurrently.
+
+    Each pipeline is sent from its own thread, so independent aggregations
+    (e.g. on different collections) run on the server at the same time
+    instead of one after the other.
+
+    Parameters:
+        db (Database): The MongoDB database instance.
+        aggregations (list): (collection name, pipeline) pairs.
+
+    Returns:
+        list: One list of result documents per pipeline, in the same order.
+              A pipeline that fails gives an empty list.
+    """
+    def aggregate(collection_name, pipeline):
+        try:
+            return list(get_collection(db, collection_name).aggregate(pipeline))
+        except Exception as e:
+            # Print error and return an empty list on failure
+            print(f"Error running aggregation on '{collection_name}': {e}")
+            return []
+
+    with ThreadPoolExecutor(max_workers=max(len(aggregations), 1)) as executor:
+        return list(executor.map(lambda pair: aggregate(*pair), aggregations))
+
+
 def create_document(db, collection_name, document):
     """
     Create (insert) a single document into a MongoDB collection.
@@ -161,7 +574,7 @@ def create_document(db, collection_name, document):
     """
     try:
         # Access the target collection
-        collection = db[collection_name]
+        collection = get_collection(db, collection_name)
 
         # Insert the document and store the result
         result = collection.insert_one(document)
@@ -174,23 +587,71 @@ def create_document(db, collection_name, document):
         return None
 
 
-def create_documents(db, collection_name, documents, id_field):
+def create_documents(db, collection_name, documents, id_field, write_concern=None, validator=None,
+                     stringify=False, batch_size=1000, bypass_document_validation=False):
     """
     Create (insert) multiple documents at once into a MongoDB collection.
 
+    The insert is an unordered bulk write, so one failing document does not
+    stop the remaining ones from being written; failures are reported and
+    only the IDs of the written documents are returned. An optional write
+    concern can be given, e.g. WriteConcern(w=0) to skip waiting for
+    acknowledgement when loading sample data. An optional validator (see
+    compile_schema) checks the documents before they are sent; invalid
+    ones are skipped.
+
+    Large lists are sent in batches of batch_size documents to keep the
+    size of each request bounded. With bypass_document_validation the
+    server does not check the documents against the collection schema
+    (only allowed for acknowledged writes).
+
     Returns:
-        list: List of inserted document IDs as strings.
+        list: List of inserted document ObjectIds (as strings if stringify is True).
+              With an unacknowledged write concern these are the documents
+              sent, the server does not confirm they were written.
               Returns an empty list if insertion fails.
     """
     try:
-        # Access the collection
-        collection = db[collection_name]
-
-        # Insert multiple documents and retrieve result
-        result = collection.insert_many(documents)
+        # Access the collection, with a specific write concern if requested
+        collection = get_collection(db, collection_name)
+        if write_concern is not None:
+            collection = collection.with_options(write_concern=write_concern)
+
+        # Validate on the client side and keep only the valid documents
+        if validator is not None:
+            valid_documents = []
+            for document in documents:
+                errors = validator(document)
+                if errors:
+                    print(f"Skipping invalid document {document.get(id_field)}: {'; '.join(errors)}")
+                else:
+                    valid_documents.append(document)
+            documents = valid_documents
+
+        if not documents:
+            return []
+
+        # Insert the documents batch by batch; a rejected document does not abort the others
+        failed_indexes = set()
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start:start + batch_size]
+            try:
+                collection.bulk_write([InsertOne(document) for document in batch], ordered=False,
+                                      bypass_document_validation=bypass_document_validation)
+            except BulkWriteError as bwe:
+                # Report each rejected document and keep the ones that were written
+                # (error indexes are relative to the batch)
+                for error in bwe.details["writeErrors"]:
+                    index = start + error["index"]
+                    print(f"Error inserting document {documents[index].get(id_field)}: {error['errmsg']}")
+                    failed_indexes.add(index)
 
         # Return list of inserted document IDs
-        return [str(id_field) for id_field in result.inserted_ids]
+        inserted_ids = [document["_id"] for index, document in enumerate(documents)
+                        if index not in failed_indexes]
+        if stringify:
+            return list(map(str, inserted_ids))
+        return inserted_ids
     except Exception as e:
         # Print error and return empty list on failure
         print(f"Error inserting documents: {e}")
@@ -200,6 +661,7 @@ def create_documents(db, collection_name, documents, id_field):
 def update_document(db, collection_name, filter_query, update_data):
     """
     Update one or more documents matching a filter with new data.
+    update_data is an update document or an update pipeline (list).
 
     Returns:
         int: Number of documents modified.
@@ -207,7 +669,7 @@ def update_document(db, collection_name, filter_query, update_data):
     """
     try:
         # Access the collection
-        collection = db[collection_name]
+        collection = get_collection(db, collection_name)
 
         # Update all matching documents
         result = collection.update_many(filter_query, update_data)
@@ -223,7 +685,9 @@ def update_document(db, collection_name, filter_query, update_data):
 def delete_document(db, collection_name, document_query):
     """
     Perform a soft delete by setting 'isActive' to False
-    instead of physically deleting the document.
+    instead of physically deleting the document. 'deletedAt' records
+    when; users, enrollments and lessons are removed for good by a TTL
+    index SOFT_DELETE_RETENTION_SECONDS after that.
 
     Returns:
         int: Number of documents updated (soft-deleted).
@@ -231,15 +695,16 @@ def delete_document(db, collection_name, document_query):
     """
     try:
         # Access the collection
-        collection = db[collection_name]
+        collection = get_collection(db, collection_name)
 
-        # Perform soft delete: mark as inactive and update timestamp
+        # Perform soft delete: mark as inactive and let the server set the
+        # update and deletion timestamps
         result = collection.update_many(
             document_query,
-            {"$set": {
-                "isActive": False,
-                "updatedAt": datetime.now()
-            }}
+            {
+                "$set": {"isActive": False},
+                "$currentDate": {"updatedAt": True, "deletedAt": True}
+            }
         )
 
         # Return number of modified documents
@@ -250,6 +715,250 @@ def delete_document(db, collection_name, document_query):
         return 0
 
 
+def add_course_tags(db, course_id, new_tags):
+    """
+    Add tags to a course, skipping the ones it already has.
+
+    The tags are merged on the client and written with $set, so the server
+    does not search the tags array for every new tag ($addToSet), and
+    nothing is written when all the tags are already there. The $set only
+    applies if the tags did not change since they were read; if another
+    writer changed them in between, the tags are added with $addToSet
+    instead, which is safe under concurrent updates.
+
+    Returns:
+        int: Number of documents modified (0 or 1).
+             Returns 0 if an error occurs.
+    """
+    try:
+        # Access the course collection
+        collection = get_collection(db, "course")
+
+        # Read the current tags only
+        course = collection.find_one({"courseId": course_id}, {"tags": 1, "_id": 0})
+        if course is None:
+            return 0
+
+        # Keep the existing order and append the new tags once each
+        current_tags = course.get("tags", [])
+        merged_tags = list(dict.fromkeys([*current_tags, *new_tags]))
+        if len(merged_tags) == len(current_tags):
+            return 0
+
+        result = collection.update_one(
+            {"courseId": course_id, "tags": current_tags},
+            {"$set": {"tags": merged_tags}, "$currentDate": {"updatedAt": True}}
+        )
+        if result.modified_count == 0:
+            # The tags changed since they were read, let the server merge them
+            result = collection.update_one(
+                {"courseId": course_id},
+                {"$addToSet": {"tags": {"$each": list(new_tags)}}, "$currentDate": {"updatedAt": True}}
+            )
+        return result.modified_count
+    except Exception as e:
+        # Print error and return 0 on failure
+        print(f"Error adding tags: {e}")
+        return 0
+
+
+def update_course_progress(db, course_id, old_status=None, new_status=None, progress_delta=0):
+    """
+    Apply an enrollment change to the course_progress roll-up of a course.
+
+    A new enrollment passes only new_status, a status change passes both
+    statuses and a removed enrollment passes only old_status. progress_delta
+    is the change of the enrollment's trackProgress. The counters and the
+    average progress are updated in one server-side pipeline update.
+
+    Returns:
+        bool: True if the roll-up is updated.
+              False if an exception occurs.
+    """
+    try:
+        # Access the roll-up collection
+        collection = get_collection(db, "course_progress")
+
+        # Counter changes caused by this enrollment change
+        deltas = defaultdict(int)
+        deltas["progressSum"] += progress_delta
+        if old_status is not None:
+            deltas[old_status] -= 1
+            deltas["enrollments"] -= 1
+        if new_status is not None:
+            deltas[new_status] += 1
+            deltas["enrollments"] += 1
+
+        # Add the deltas (missing counters start at 0), then recompute the average
+        collection.update_one(
+            {"courseId": course_id},
+            [
+                {"$set": {field: {"$add": [{"$ifNull": [f"${field}", 0]}, delta]}
+                          for field, delta in deltas.items()}},
+                {"$set": {"avgProgress": {"$cond": [
+                    {"$gt": ["$enrollments", 0]},
+                    {"$divide": ["$progressSum", "$enrollments"]},
+                    0
+                ]}}}
+            ],
+            upsert=True
+        )
+        return True
+    except Exception as e:
+        # Print error and return False if the update fails
+        print(f"Error updating course progress: {e}")
+        return False
+
+
+def delete_enrollment(db, enrollment_id):
+    """
+    Soft-delete an enrollment (see delete_document) and remove it from the
+    course_progress roll-up of its course.
+
+    The enrollment's status and progress are read by the same command that
+    deactivates it, so the roll-up is only changed once even if the
+    enrollment is deleted twice.
+
+    Returns:
+        int: Number of enrollments soft-deleted (0 or 1).
+             Returns 0 if an error occurs.
+    """
+    try:
+        # Access the enrollment collection
+        collection = get_collection(db, "enrollment")
+
+        # Deactivate the enrollment if it is still active and get its values before the change
+        enrollment = collection.find_one_and_update(
+            {"enrollmentId": enrollment_id, "isActive": True},
+            {
+                "$set": {"isActive": False},
+                "$currentDate": {"updatedAt": True, "deletedAt": True}
+            },
+            projection={"_id": 0, "courseId": 1, "completionStatus": 1, "trackProgress": 1},
+            return_document=ReturnDocument.BEFORE
+        )
+        if enrollment is None:
+            return 0
+
+        # The enrollment no longer counts in its course's progress
+        update_course_progress(db, enrollment["courseId"],
+                               old_status=enrollment.get("completionStatus", "not_started"),
+                               progress_delta=-enrollment.get("trackProgress", 0))
+        return 1
+    except Exception as e:
+        # Print error and return 0 if operation fails
+        print(f"Error performing soft delete: {e}")
+        return 0
+
+
+def record_attendance(db, enrollment_id, lesson_id, has_finished=True, attended_at=None):
+    """
+    Record the attendance of a lesson for an enrollment.
+
+    Attendance is stored in its own collection, one document per
+    (enrollmentId, lessonId), instead of an array growing inside the
+    enrollment document. The record is created on the first call and
+    updated in place on the next ones. Like the sample attendance records,
+    it holds a copy of the lesson's title and courseId.
+
+    Parameters:
+        db (Database): The MongoDB database instance.
+        enrollment_id (int): ID of the enrollment.
+        lesson_id (int): ID of the attended lesson.
+        has_finished (bool): Whether the lesson is finished.
+        attended_at (datetime): When the lesson was attended, now by default.
+
+    Returns:
+        bool: True if the attendance is recorded.
+              False if an exception occurs.
+    """
+    try:
+        # Read the lesson fields copied into the attendance record
+        lesson = get_collection(db, "lesson").find_one({"lessonId": lesson_id}, {"_id": 0, "title": 1, "courseId": 1})
+        if lesson is None:
+            print(f"Lesson {lesson_id} not found")
+            return False
+
+        # Access the attendance collection
+        collection = get_collection(db, "attendance")
+
+        # Create or update the record of this enrollment and lesson
+        collection.update_one(
+            {"enrollmentId": enrollment_id, "lessonId": lesson_id},
+            {"$set": {"hasFinished": has_finished,
+                      "attendedAt": attended_at or datetime.now(timezone.utc),
+                      "lessonTitle": lesson["title"],
+                      "courseId": lesson["courseId"]}},
+            upsert=True
+        )
+        return True
+    except Exception as e:
+        # Print error and return False on failure
+        print(f"Error recording attendance: {e}")
+        return False
+
+
+def bulk_apply(db, collection_name, operations, batch_size=100):
+    """
+    Apply a list of write operations (InsertOne, UpdateOne, UpdateMany,
+    DeleteOne, ...) to a collection.
+
+    The operations are sent as unordered bulk writes of up to batch_size
+    operations, one round trip per batch instead of one per operation. A
+    failing operation does not stop the others; failures are reported.
+
+    Parameters:
+        db (Database): The MongoDB database instance.
+        collection_name (str): Name of the collection.
+        operations (list): Write operations to apply.
+        batch_size (int): Maximum number of operations per request.
+
+    Returns:
+        dict: Totals of the applied operations, with the keys nInserted,
+              nUpserted, nMatched, nModified and nRemoved.
+              Returns the totals so far if an error occurs.
+    """
+    totals = dict.fromkeys(["nInserted", "nUpserted", "nMatched", "nModified", "nRemoved"], 0)
+    try:
+        # Access the collection
+        collection = get_collection(db, collection_name)
+
+        for start in range(0, len(operations), batch_size):
+            try:
+                counts = collection.bulk_write(operations[start:start + batch_size], ordered=False).bulk_api_result
+            except BulkWriteError as bwe:
+                # The operations that did not fail are applied anyway
+                counts = bwe.details
+                for error in counts["writeErrors"]:
+                    print(f"Error applying operation {start + error['index']}: {error['errmsg']}")
+
+            for key in totals:
+                totals[key] += counts[key]
+    except Exception as e:
+        # Print error and return the totals of the applied batches
+        print(f"Error applying operations: {e}")
+    return totals
+
+
+def delete_documents(db, collection_name, document_queries):
+    """
+    Perform a soft delete for several filters in a single request.
+
+    Every filter becomes one update setting 'isActive' to False; all of
+    them are sent together as unordered bulk writes (see bulk_apply).
+
+    Returns:
+        int: Number of documents updated (soft-deleted).
+             Returns 0 if an error occurs.
+    """
+    # One soft-delete operation per filter; the server sets the update and deletion timestamps
+    soft_delete = {"$set": {"isActive": False}, "$currentDate": {"updatedAt": True, "deletedAt": True}}
+    operations = [UpdateMany(document_query, soft_delete) for document_query in document_queries]
+
+    # Return number of modified documents
+    return bulk_apply(db, collection_name, operations)["nModified"]
+
+
 # In[166]:
 
 
@@ -277,34 +986,135 @@ lesson_collection = "lesson"
 assignment_collection = "assignment"   
 submission_collection = "submission" 
 enrollment_collection = "enrollment"  
+course_progress_collection = "course_progress"
+attendance_collection = "attendance"
 
+#collation comparing strings without case ("aws" equals "AWS"), shared by the
+#course title_ci index and the queries that use it
+CASE_INSENSITIVE = Collation(locale="en", strength=2)
 
 
-# In[177]:
+# 3. Compile the Schemas into Client-Side Validators
+# ------------------------------------------------------------
+# Each schema is compiled once and reused to check documents
+# before they are sent to MongoDB
+
+schema_validators = {
+    user_collection: compile_schema(user_schema),
+    course_collection: compile_schema(course_schema),
+    lesson_collection: compile_schema(lesson_schema),
+    assignment_collection: compile_schema(assignment_schema),
+    submission_collection: compile_schema(submission_schema),
+    enrollment_collection: compile_schema(enrollment_schema),
+}
 
 
-# 2. Create Collections with Schema Validation
+# 4. Aggregation Pipelines
 # ------------------------------------------------------------
-# Each call creates a MongoDB collection (if it doesn't already exist) and applies a JSON schema validator.
-#Enforces data consistency and integrity by validating all inserted or updated documents against the specified schema.
+# The pipelines of Part 4 are built once here and reused by the
+# cells that run them
+
+#Task 4.2, 1.1: total enrollments per course
+ENROLLMENTS_PER_COURSE_PIPELINE = [
+    {
+        # read the enrollments in courseId order: the sort is served by the
+        # (courseId, studentId) index, and only courseId is needed, so the
+        # enrollments are counted from the index without reading them
+        "$sort": {"courseId": 1}
+    },
+    {
+        # $group stage aggregates documents by a specified key
+        "$group": {
+            "_id": "$courseId",                #group by 'courseId'
+            "totalEnrollments": {"$sum": 1}   #count each document in the group
+        }
+    }
+]
+
+#Task 4.2, 1.2: average course rating per category
+RATING_PER_CATEGORY_PIPELINE = [
+    {
+        "$group": {
+            "_id": "$category",               # group by course category
+            "averageRating": {"$avg": "$reviewRate"}  #average rating per category
+        }
+    },
+    {
+        "$sort": {"averageRating": -1}      #sort by highest rating
+    }
+]
+
+#Task 4.2, 2.1: average grade per student
+#the grades are first summed per enrollment, so the $lookup only runs once
+#per enrollment with submissions (instead of once per enrollment, followed
+#by one document per submission); sums and counts are then added up per
+#student, which gives the same average as averaging every submission
+AVERAGE_GRADE_PER_STUDENT_PIPELINE = [
+    {
+        "$match": {"grade": {"$type": "number"}}   #graded submissions only
+    },
+    {
+        "$group": {
+            "_id": "$enrollmentId",   #group by enrollment
+            "gradeSum": {"$sum": "$grade"},
+            "gradeCount": {"$sum": 1}
+        }
+    },
+    {
+        "$lookup": {
+            "from": enrollment_collection,       #enrollment collection with the students
+            "localField": "_id",
+            "foreignField": "enrollmentId",      #uses the unique enrollmentId index
+            "pipeline": [
+                {"$project": {"_id": 0, "studentId": 1}}  #only the student is needed
+            ],
+            "as": "enrollment"
+        }
+    },
+    {
+        "$unwind": "$enrollment"      #one enrollment per group
+    },
+    {
+        "$group": {
+            "_id": "$enrollment.studentId",      #group by student
+            "gradeSum": {"$sum": "$gradeSum"},
+            "gradeCount": {"$sum": "$gradeCount"}
+        }
+    },
+    {
+        "$project": {
+            "averageGrade": {"$divide": ["$gradeSum", "$gradeCount"]}
+        }
+    },
+    {
+        "$sort": { "averageGrade": -1 } #highest first
+    }
+]
 
-#Create 'user' collection with its validation schema
-create_collection_with_schema(db, user_collection, user_schema)
 
-#Create 'course' collection with its validation schema
-create_collection_with_schema(db, course_collection, course_schema)
 
-#Create  'enrollment' collection with its validation schema
-create_collection_with_schema(db, enrollment_collection, enrollment_schema)
+# In[177]:
 
-#Create 'lesson' collection with its validation schema
-create_collection_with_schema(db, lesson_collection, lesson_schema)
 
-#Create 'assignment' collection with its validation schema
-create_collection_with_schema(db, assignment_collection, assignment_schema)
+# 2. Create Collections with Schema Validation
+# ------------------------------------------------------------
+# Each call creates a MongoDB collection (if it doesn't already exist) and applies a JSON schema validator.
+#Enforces data consistency and integrity by validating all inserted or updated documents against the specified schema.
+
+#(collection name, validation schema) pairs to create
+collection_schemas = [
+    (user_collection, user_schema),
+    (course_collection, course_schema),
+    (enrollment_collection, enrollment_schema),
+    (lesson_collection, lesson_schema),
+    (assignment_collection, assignment_schema),
+    (submission_collection, submission_schema),
+]
 
-#Create 'submission' collection with its validation schema
-create_collection_with_schema(db, submission_collection, submission_schema)
+#each creation is an independent command, so send them concurrently
+#instead of waiting for one round trip after another
+with ThreadPoolExecutor(max_workers=len(collection_schemas)) as executor:
+    list(executor.map(lambda pair: create_collection_with_schema(db, *pair), collection_schemas))
 
 
 
@@ -318,791 +1128,183 @@ lesson = db[lesson_collection]
 assignment = db[assignment_collection]
 submission = db[submission_collection]
 
-#create indexes for unique identifiers
-
-#each user has a unique userId
-#prevents inserting two users with the same ID
-user.create_index("userId", unique=True)
-
-#each enrollment has a unique enrollmentId
-#prevents duplicate enrollment records with the same ID
-enrollment.create_index("enrollmentId", unique=True)
-
-#create a unique compound index to prevent the same student from enrolling in the same course more than once
-#combination of courseId + studentId must be unique
-enrollment.create_index([("courseId", 1), ("studentId", 1)], unique=True)
-
-#each lesson has a unique lessonId
-#prevents duplicate lessons with the same ID
-lesson.create_index("lessonId", unique=True)
-
-#each assignment has a unique assignmentId
-#prevents duplicate assignments with the same ID
-assignment.create_index("assignmentId", unique=True)
-
-#each submission has a unique submissionId
-#prevents duplicate submissions with the same ID
-submission.create_index("submissionId", unique=True)
-
-
-# In[169]:
-
-
-users_data = [
-    {"userId": 1, "email": "alice.student@example.com", "firstName": "Alice", "lastName": "Johnson", "role": "student",
-     "joinedAt": datetime(2023, 1, 15, 10, 0, 0), "profile": {"bio": "Loves learning Python", "avatar": "", "skills": ["Python", "Data Analysis"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 20, 12, 0, 0)},
-    {"userId": 2, "email": "bob.student@example.com", "firstName": "Bob", "lastName": "Smith", "role": "student",
-     "joinedAt": datetime(2023, 2, 10, 9, 30, 0), "profile": {"bio": "Front-end enthusiast", "avatar": "", "skills": ["HTML", "CSS", "JavaScript"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 18, 11, 0, 0)},
-    {"userId": 3, "email": "carol.student@example.com", "firstName": "Carol", "lastName": "Davis", "role": "student",
-     "joinedAt": datetime(2023, 3, 1, 8, 45, 0), "profile": {"bio": "Data Science beginner", "avatar": "", "skills": ["Python", "Statistics"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 15, 10, 0, 0)},
-    {"userId": 4, "email": "david.student@example.com", "firstName": "David", "lastName": "Wilson", "role": "student",
-     "joinedAt": datetime(2023, 1, 20, 10, 15, 0), "profile": {"bio": "AI hobbyist", "avatar": "", "skills": ["Python", "Machine Learning"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 19, 9, 30, 0)},
-    {"userId": 5, "email": "emma.student@example.com", "firstName": "Emma", "lastName": "Taylor", "role": "student",
-     "joinedAt": datetime(2023, 2, 25, 11, 0, 0), "profile": {"bio": "Web developer in training", "avatar": "", "skills": ["HTML", "CSS"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 15, 0)},
-    {"userId": 6, "email": "frank.student@example.com", "firstName": "Frank", "lastName": "Anderson", "role": "student",
-     "joinedAt": datetime(2023, 3, 10, 9, 30, 0), "profile": {"bio": "Interested in DevOps", "avatar": "", "skills": ["Docker", "Kubernetes"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 20, 11, 45, 0)},
-    {"userId": 7, "email": "grace.student@example.com", "firstName": "Grace", "lastName": "Thomas", "role": "student",
-     "joinedAt": datetime(2023, 1, 28, 10, 0, 0), "profile": {"bio": "Learning backend development", "avatar": "", "skills": ["Node.js", "Express"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 19, 10, 30, 0)},
-    {"userId": 8, "email": "henry.student@example.com", "firstName": "Henry", "lastName": "Moore", "role": "student",
-     "joinedAt": datetime(2023, 2, 5, 9, 0, 0), "profile": {"bio": "Database enthusiast", "avatar": "", "skills": ["SQL", "PostgreSQL"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 18, 11, 15, 0)},
-    {"userId": 9, "email": "isabel.student@example.com", "firstName": "Isabel", "lastName": "Martin", "role": "student",
-     "joinedAt": datetime(2023, 3, 12, 8, 30, 0), "profile": {"bio": "Learning AI", "avatar": "", "skills": ["Python", "TensorFlow"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 21, 9, 50, 0)},
-    {"userId": 10, "email": "jack.student@example.com", "firstName": "Jack", "lastName": "Lee", "role": "student",
-     "joinedAt": datetime(2023, 1, 18, 10, 20, 0), "profile": {"bio": "Cloud computing beginner", "avatar": "", "skills": ["AWS", "Azure"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 40, 0)},
-    {"userId": 11, "email": "kate.student@example.com", "firstName": "Kate", "lastName": "Perez", "role": "student",
-     "joinedAt": datetime(2023, 2, 22, 11, 10, 0), "profile": {"bio": "Cybersecurity enthusiast", "avatar": "", "skills": ["Network Security", "Linux"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 19, 12, 0, 0)},
-    {"userId": 12, "email": "leo.student@example.com", "firstName": "Leo", "lastName": "Harris", "role": "student",
-     "joinedAt": datetime(2023, 3, 5, 9, 50, 0), "profile": {"bio": "Loves Python scripting", "avatar": "", "skills": ["Python", "Automation"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 18, 10, 20, 0)},
-    {"userId": 13, "email": "mia.student@example.com", "firstName": "Mia", "lastName": "Clark", "role": "student",
-     "joinedAt": datetime(2023, 1, 30, 10, 5, 0), "profile": {"bio": "Full-stack web developer", "avatar": "", "skills": ["React", "Node.js"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 21, 11, 10, 0)},
-    {"userId": 14, "email": "nick.student@example.com", "firstName": "Nick", "lastName": "Lewis", "role": "student",
-     "joinedAt": datetime(2023, 2, 12, 9, 40, 0), "profile": {"bio": "Interested in DevOps", "avatar": "", "skills": ["Docker", "CI/CD"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 20, 12, 30, 0)},
-    {"userId": 15, "email": "olivia.student@example.com", "firstName": "Olivia", "lastName": "Walker", "role": "student",
-     "joinedAt": datetime(2023, 3, 7, 8, 50, 0), "profile": {"bio": "Learning Data Science", "avatar": "", "skills": ["Python", "Pandas"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 19, 10, 50, 0)},
-    {"userId": 16, "email": "paul.student@example.com", "firstName": "Paul", "lastName": "Hall", "role": "student",
-     "joinedAt": datetime(2023, 1, 25, 10, 30, 0), "profile": {"bio": "Interested in AI", "avatar": "", "skills": ["Python", "Keras"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 10, 0)},
-    {"userId": 17, "email": "queen.instructor@example.com", "firstName": "Queen", "lastName": "Allen", "role": "instructor",
-     "joinedAt": datetime(2022, 12, 10, 9, 0, 0), "profile": {"bio": "Expert in Python", "avatar": "", "skills": ["Python", "Data Science"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 15, 12, 0, 0)},
-    {"userId": 18, "email": "roger.instructor@example.com", "firstName": "Roger", "lastName": "Young", "role": "instructor",
-     "joinedAt": datetime(2022, 11, 5, 8, 30, 0), "profile": {"bio": "Web development instructor", "avatar": "", "skills": ["HTML", "CSS", "JavaScript"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 18, 11, 40, 0)},
-    {"userId": 19, "email": "sophia.instructor@example.com", "firstName": "Sophia", "lastName": "King", "role": "instructor",
-     "joinedAt": datetime(2022, 12, 15, 9, 15, 0), "profile": {"bio": "AI and ML instructor", "avatar": "", "skills": ["Python", "Machine Learning"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 30, 0)},
-    {"userId": 20, "email": "tom.instructor@example.com", "firstName": "Tom", "lastName": "Scott", "role": "instructor",
-     "joinedAt": datetime(2022, 12, 20, 8, 45, 0), "profile": {"bio": "Cloud computing instructor", "avatar": "", "skills": ["AWS", "Azure"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 21, 11, 50, 0)},
-    {"userId": 21, "email": "uma.student@example.com", "firstName": "Uma", "lastName": "Adams", "role": "student",
-     "joinedAt": datetime(2023, 2, 1, 10, 10, 0), "profile": {"bio": "Learning front-end", "avatar": "", "skills": ["React", "CSS"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 20, 0)},
-    {"userId": 22, "email": "victor.student@example.com", "firstName": "Victor", "lastName": "Baker", "role": "student",
-     "joinedAt": datetime(2023, 2, 18, 9, 35, 0), "profile": {"bio": "Backend beginner", "avatar": "", "skills": ["Node.js", "Express"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 19, 11, 15, 0)},
-    {"userId": 23, "email": "wendy.student@example.com", "firstName": "Wendy", "lastName": "Carter", "role": "student",
-     "joinedAt": datetime(2023, 3, 3, 8, 55, 0), "profile": {"bio": "Learning DevOps", "avatar": "", "skills": ["Docker", "Kubernetes"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 40, 0)},
-    {"userId": 24, "email": "xander.student@example.com", "firstName": "Xander", "lastName": "Evans", "role": "student",
-     "joinedAt": datetime(2023, 1, 27, 10, 20, 0), "profile": {"bio": "Database learner", "avatar": "", "skills": ["SQL", "PostgreSQL"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 18, 10, 50, 0)},
-    {"userId": 25, "email": "yara.student@example.com", "firstName": "Yara", "lastName": "Foster", "role": "student",
-     "joinedAt": datetime(2023, 2, 8, 9, 50, 0), "profile": {"bio": "Learning AI", "avatar": "", "skills": ["Python", "TensorFlow"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 20, 11, 25, 0)},
-    {"userId": 26, "email": "zane.student@example.com", "firstName": "Zane", "lastName": "Green", "role": "student",
-     "joinedAt": datetime(2023, 3, 11, 8, 40, 0), "profile": {"bio": "Python and ML beginner", "avatar": "", "skills": ["Python", "ML"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 5, 0)},
-    {"userId": 27, "email": "amy.student@example.com", "firstName": "Amy", "lastName": "Hughes", "role": "student",
-     "joinedAt": datetime(2023, 1, 19, 10, 5, 0), "profile": {"bio": "Interested in cybersecurity", "avatar": "", "skills": ["Network Security", "Linux"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 35, 0)},
-    {"userId": 28, "email": "brian.student@example.com", "firstName": "Brian", "lastName": "Irwin", "role": "student",
-     "joinedAt": datetime(2023, 2, 28, 9, 20, 0), "profile": {"bio": "Learning cloud computing", "avatar": "", "skills": ["AWS", "Azure"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 19, 11, 55, 0)},
-    {"userId": 29, "email": "chloe.student@example.com", "firstName": "Chloe", "lastName": "Jones", "role": "student",
-     "joinedAt": datetime(2023, 3, 6, 8, 50, 0), "profile": {"bio": "Data science enthusiast", "avatar": "", "skills": ["Python", "Pandas"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 30, 0)},
-    {"userId": 30, "email": "daniel.student@example.com", "firstName": "Daniel", "lastName": "Kelly", "role": "student",
-     "joinedAt": datetime(2023, 1, 23, 10, 25, 0), "profile": {"bio": "Interested in AI and ML", "avatar": "", "skills": ["Python", "Keras"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 55, 0)},
-    {"userId": 31, "email": "ella.student@example.com", "firstName": "Ella", "lastName": "Lopez", "role": "student",
-     "joinedAt": datetime(2023, 2, 14, 9, 40, 0), "profile": {"bio": "Front-end learner", "avatar": "", "skills": ["HTML", "CSS", "React"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 19, 11, 10, 0)},
-    {"userId": 32, "email": "fred.student@example.com", "firstName": "Fred", "lastName": "Morris", "role": "student",
-     "joinedAt": datetime(2023, 3, 9, 8, 35, 0), "profile": {"bio": "Learning backend development", "avatar": "", "skills": ["Node.js", "Express"]},
-     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 20, 0)}
+#indexes of every collection, created together by ensure_indexes() below
+#(the indexes of Part 5 are included, see the notes there)
+#fields of compound indexes are ordered equality -> sort -> range so a
+#prefix of each index can also serve queries on fewer fields
+
+#soft-deleted users, enrollments and lessons (deletedAt set by
+#delete_document) are physically removed after 90 days, so they do not keep
+#taking space in the collections and their indexes
+SOFT_DELETE_RETENTION_SECONDS = 90 * 24 * 60 * 60
+
+USER_INDEXES = [
+    #each user has a unique userId
+    #prevents inserting two users with the same ID
+    IndexModel("userId", unique=True),
+
+    #active users by role
+    #the name and email keys let the active students query (Read Operation 1)
+    #be answered from the index alone, without reading the user documents;
+    #inactive users are left out of the index to keep it small
+    IndexModel([("role", 1), ("isActive", 1), ("firstName", 1), ("lastName", 1), ("email", 1)],
+               partialFilterExpression={"isActive": True}),
+
+    #users by email (unique), Part 5 index 1
+    IndexModel("email", unique=True),
+
+    #users by join date, for the joined in the last 6 months query
+    IndexModel("joinedAt"),
+
+    #removes soft-deleted users once the retention period is over
+    IndexModel("deletedAt", expireAfterSeconds=SOFT_DELETE_RETENTION_SECONDS)
 ]
 
+COURSE_INDEXES = [
+    #courses by instructor (and publication/active state)
+    IndexModel([("instructorId", 1), ("isPublished", 1), ("isActive", 1)]),
+
+    #courses by category and level, also used by category-only queries
+    #(Read Operation 3)
+    IndexModel([("category", 1), ("difficultyLevel", 1)]),
 
-# In[170]:
-
-
-courses_data = [
-    {"courseId": 1, "title": "Introduction to Python", "description": "Learn the basics of Python programming.",
-     "instructorId": 17, "category": "Programming", "difficultyLevel": "beginner", "duration": 20, "price": 49.99,
-     "tags": ["python", "programming", "basics"], "isPublished": True, "isActive": True, "reviewRate": 4.5,
-     "createdAt": datetime(2023, 1, 10, 9, 0, 0), "updatedAt": datetime(2023, 5, 1, 12, 0, 0)},
-    {"courseId": 2, "title": "Advanced Python", "description": "Master advanced Python concepts and best practices.",
-     "instructorId": 18, "category": "Programming", "difficultyLevel": "advanced", "duration": 35, "price": 99.99,
-     "tags": ["python", "advanced", "OOP"], "isPublished": True, "isActive": True, "reviewRate": 4.8,
-     "createdAt": datetime(2023, 2, 15, 10, 0, 0), "updatedAt": datetime(2023, 6, 20, 14, 0, 0)},
-    {"courseId": 3, "title": "Data Science Basics", "description": "Introduction to data science, statistics, and visualization.",
-     "instructorId": 19, "category": "Data Science", "difficultyLevel": "beginner", "duration": 25, "price": 59.99,
-     "tags": ["data science", "statistics", "visualization"], "isPublished": True, "isActive": True, "reviewRate": 4.6,
-     "createdAt": datetime(2023, 3, 1, 11, 0, 0), "updatedAt": datetime(2023, 6, 15, 12, 0, 0)},
-    {"courseId": 4, "title": "Machine Learning A-Z", "description": "Learn machine learning algorithms from scratch.",
-     "instructorId": 20, "category": "Data Science", "difficultyLevel": "intermidiate", "duration": 40, "price": 129.99,
-     "tags": ["machine learning", "python", "AI"], "isPublished": True, "isActive": True, "reviewRate": 4.7,
-     "createdAt": datetime(2023, 3, 10, 9, 0, 0), "updatedAt": datetime(2023, 7, 1, 15, 0, 0)},
-    {"courseId": 5, "title": "Web Development with HTML, CSS, JS",
-     "description": "Build interactive websites using HTML, CSS, and JavaScript.",
-     "instructorId": 17, "category": "Web Development", "difficultyLevel": "beginner", "duration": 30, "price": 79.99,
-     "tags": ["web", "html", "css", "javascript"], "isPublished": True, "isActive": True, "reviewRate": 4.3,
-     "createdAt": datetime(2023, 1, 20, 8, 0, 0), "updatedAt": datetime(2023, 5, 25, 13, 0, 0)},
-    {"courseId": 6, "title": "React for Beginners", "description": "Learn how to build dynamic front-end applications using React.",
-     "instructorId": 18, "category": "Web Development", "difficultyLevel": "beginner", "duration": 28, "price": 89.99,
-     "tags": ["react", "javascript", "frontend"], "isPublished": True, "isActive": True, "reviewRate": 4.4,
-     "createdAt": datetime(2023, 2, 5, 10, 30, 0), "updatedAt": datetime(2023, 6, 5, 12, 30, 0)},
-    {"courseId": 7, "title": "Node.js and Express", "description": "Server-side development with Node.js and Express.",
-     "instructorId": 19, "category": "Backend Development", "difficultyLevel": "intermidiate", "duration": 32, "price": 99.99,
-     "tags": ["nodejs", "express", "backend"], "isPublished": True, "isActive": True, "reviewRate": 4.5,
-     "createdAt": datetime(2023, 3, 1, 9, 30, 0), "updatedAt": datetime(2023, 7, 10, 14, 0, 0)},
-    {"courseId": 8, "title": "Docker Essentials", "description": "Learn containerization concepts and Docker fundamentals.",
-     "instructorId": 20, "category": "DevOps", "difficultyLevel": "beginner", "duration": 18, "price": 59.99,
-     "tags": ["docker", "containers", "devops"], "isPublished": True, "isActive": True, "reviewRate": 4.2,
-     "createdAt": datetime(2023, 1, 25, 11, 0, 0), "updatedAt": datetime(2023, 5, 30, 13, 30, 0)},
-    {"courseId": 9, "title": "Kubernetes for Beginners", "description": "Introduction to Kubernetes and container orchestration.",
-     "instructorId": 17, "category": "DevOps", "difficultyLevel": "intermidiate", "duration": 25, "price": 79.99,
-     "tags": ["kubernetes", "containers", "orchestration"], "isPublished": True, "isActive": True, "reviewRate": 4.3,
-     "createdAt": datetime(2023, 2, 15, 9, 45, 0), "updatedAt": datetime(2023, 6, 20, 12, 30, 0)},
-    {"courseId": 10, "title": "SQL for Beginners", "description": "Learn to query databases using SQL.",
-     "instructorId": 18, "category": "Database", "difficultyLevel": "beginner", "duration": 20, "price": 49.99,
-     "tags": ["sql", "database", "query"], "isPublished": True, "isActive": True, "reviewRate": 4.4,
-     "createdAt": datetime(2023, 1, 12, 8, 30, 0), "updatedAt": datetime(2023, 5, 15, 11, 0, 0)},
-    {"courseId": 11, "title": "PostgreSQL Advanced", "description": "Advanced PostgreSQL features and optimization techniques.",
-     "instructorId": 19, "category": "Database", "difficultyLevel": "advanced", "duration": 30, "price": 99.99,
-     "tags": ["postgresql", "database", "advanced"], "isPublished": True, "isActive": True, "reviewRate": 4.6,
-     "createdAt": datetime(2023, 3, 1, 10, 0, 0), "updatedAt": datetime(2023, 6, 25, 14, 0, 0)},
-    {"courseId": 12, "title": "Introduction to AI", "description": "Basic concepts and applications of Artificial Intelligence.",
-     "instructorId": 20, "category": "AI", "difficultyLevel": "beginner", "duration": 22, "price": 69.99,
-     "tags": ["AI", "artificial intelligence", "machine learning"], "isPublished": True, "isActive": True, "reviewRate": 4.3,
-     "createdAt": datetime(2023, 2, 1, 11, 0, 0), "updatedAt": datetime(2023, 6, 5, 12, 0, 0)},
-    {"courseId": 13, "title": "Advanced AI Techniques", "description": "Deep dive into AI algorithms and neural networks.",
-     "instructorId": 17, "category": "AI", "difficultyLevel": "advanced", "duration": 40, "price": 149.99,
-     "tags": ["AI", "neural networks", "deep learning"], "isPublished": True, "isActive": True, "reviewRate": 4.7,
-     "createdAt": datetime(2023, 3, 15, 9, 0, 0), "updatedAt": datetime(2023, 7, 5, 14, 0, 0)},
-    {"courseId": 14, "title": "Cloud Computing Basics", "description": "Learn the fundamentals of cloud services and architecture.",
-     "instructorId": 18, "category": "Cloud", "difficultyLevel": "beginner", "duration": 18, "price": 59.99,
-     "tags": ["cloud", "AWS", "azure", "basics"], "isPublished": True, "isActive": True, "reviewRate": 4.2,
-     "createdAt": datetime(2023, 1, 28, 10, 0, 0), "updatedAt": datetime(2023, 6, 1, 12, 0, 0)},
-    {"courseId": 15, "title": "AWS Certified Solutions Architect",
-     "description": "Prepare for AWS certification with hands-on labs and examples.", "instructorId": 19,
-     "category": "Cloud", "difficultyLevel": "intermidiate", "duration": 35, "price": 129.99,
-     "tags": ["AWS", "cloud", "certification"], "isPublished": True, "isActive": True, "reviewRate": 4.6,
-     "createdAt": datetime(2023, 2, 10, 9, 30, 0), "updatedAt": datetime(2023, 6, 20, 14, 0, 0)},
-    {"courseId": 16, "title": "Cybersecurity Fundamentals", "description": "Introduction to cybersecurity concepts and practices.",
-     "instructorId": 20, "category": "Security", "difficultyLevel": "beginner", "duration": 25, "price": 79.99,
-     "tags": ["cybersecurity", "security", "basics"], "isPublished": True, "isActive": True, "reviewRate": 4.4,
-     "createdAt": datetime(2023, 3, 1, 10, 30, 0), "updatedAt": datetime(2023, 7, 1, 15, 30, 0)}
+    #published and active courses by category (the published catalogue
+    #query after Read Operation 3); only holds those courses, so it is smaller than the
+    #index above, and queries must include both conditions to use it
+    IndexModel("category", partialFilterExpression={"isPublished": True, "isActive": True}),
+
+    #courses by tag
+    IndexModel("tags"),
+
+    #text index on title, used by $text searches, Part 5 index 2
+    IndexModel([("title", "text")]),
+
+    #case-insensitive index on title, used by title prefix searches (Read
+    #Operation 5); queries must use the same collation to use it
+    IndexModel("title", name="title_ci", collation=CASE_INSENSITIVE)
 ]
 
+ENROLLMENT_INDEXES = [
+    #each enrollment has a unique enrollmentId
+    #prevents duplicate enrollment records with the same ID
+    IndexModel("enrollmentId", unique=True),
 
-# In[181]:
+    #prevents the same student from enrolling in the same course more than once
+    #combination of courseId + studentId must be unique
+    IndexModel([("courseId", 1), ("studentId", 1)], unique=True),
 
+    #enrollments of a student, Part 5 index 4
+    IndexModel([("studentId", 1), ("courseId", 1)]),
 
-enrollments_data = [
-    {
-        "enrollmentId": 1,
-        "courseId": 1,
-        "studentId": 1,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 20,
-        "attendance": [
-            {"lessonId": 1, "hasFinished": True, "attendedAt": datetime(2023, 9, 1, 10, 0, 0)},
-            {"lessonId": 2, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 20, 12, 0, 0),
-        "updatedAt": datetime(2023, 9, 1, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 2,
-        "courseId": 2,
-        "studentId": 2,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 50,
-        "attendance": [
-            {"lessonId": 3, "hasFinished": True, "attendedAt": datetime(2023, 9, 2, 11, 0, 0)},
-            {"lessonId": 4, "hasFinished": True, "attendedAt": datetime(2023, 9, 5, 11, 0, 0)}
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 22, 9, 0, 0),
-        "updatedAt": datetime(2023, 9, 5, 12, 0, 0)
-    },
-    {
-        "enrollmentId": 3,
-        "courseId": 3,
-        "studentId": 3,
-        "isActive": True,
-        "completionStatus": "not_started",
-        "trackProgress": 0,
-        "attendance": [
-            {"lessonId": 5, "hasFinished": False, "attendedAt":  datetime.now() },
-            {"lessonId": 6, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 25, 10, 30, 0),
-        "updatedAt": datetime(2023, 8, 25, 10, 30, 0)
-    },
-    {
-        "enrollmentId": 4,
-        "courseId": 1,
-        "studentId": 4,
-        "isActive": True,
-        "completionStatus": "completed",
-        "trackProgress": 100,
-        "attendance": [
-            {"lessonId": 1, "hasFinished": True, "attendedAt": datetime(2023, 8, 28, 9, 0, 0)},
-            {"lessonId": 2, "hasFinished": True, "attendedAt": datetime(2023, 8, 30, 9, 30, 0)}
-        ],
-        "completionDate": datetime(2023, 8, 31, 12, 0, 0),
-        "createdAt": datetime(2023, 8, 20, 12, 10, 0),
-        "updatedAt": datetime(2023, 8, 31, 12, 5, 0)
-    },
-    {
-        "enrollmentId": 5,
-        "courseId": 4,
-        "studentId": 5,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 30,
-        "attendance": [
-            {"lessonId": 7, "hasFinished": True, "attendedAt": datetime(2023, 9, 3, 10, 0, 0)},
-            {"lessonId": 8, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 23, 11, 0, 0),
-        "updatedAt": datetime(2023, 9, 3, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 6,
-        "courseId": 2,
-        "studentId": 6,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 40,
-        "attendance": [
-            {"lessonId": 3, "hasFinished": True, "attendedAt": datetime(2023, 9, 4, 9, 30, 0)},
-            {"lessonId": 4, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 22, 9, 15, 0),
-        "updatedAt": datetime(2023, 9, 4, 9, 35, 0)
-    },
-    {
-        "enrollmentId": 7,
-        "courseId": 5,
-        "studentId": 7,
-        "isActive": True,
-        "completionStatus": "not_started",
-        "trackProgress": 0,
-        "attendance": [
-            {"lessonId": 9, "hasFinished": False, "attendedAt":  datetime.now() },
-            {"lessonId": 10, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 24, 10, 45, 0),
-        "updatedAt": datetime(2023, 8, 24, 10, 45, 0)
-    },
-    {
-        "enrollmentId": 8,
-        "courseId": 3,
-        "studentId": 8,
-        "isActive": True,
-        "completionStatus": "completed",
-        "trackProgress": 100,
-        "attendance": [
-            {"lessonId": 5, "hasFinished": True, "attendedAt": datetime(2023, 8, 29, 10, 0, 0)},
-            {"lessonId": 6, "hasFinished": True, "attendedAt": datetime(2023, 9, 1, 10, 30, 0)}
-        ],
-        "completionDate": datetime(2023, 9, 2, 12, 0, 0),
-        "createdAt": datetime(2023, 8, 25, 10, 35, 0),
-        "updatedAt": datetime(2023, 9, 2, 12, 5, 0)
-    },
-    {
-        "enrollmentId": 9,
-        "courseId": 6,
-        "studentId": 9,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 15,
-        "attendance": [
-            {"lessonId": 11, "hasFinished": True, "attendedAt": datetime(2023, 9, 5, 10, 0, 0)},
-            {"lessonId": 12, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 26, 9, 50, 0),
-        "updatedAt": datetime(2023, 9, 5, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 10,
-        "courseId": 4,
-        "studentId": 10,
-        "isActive": True,
-        "completionStatus": "not_started",
-        "trackProgress": 0,
-        "attendance": [
-            {"lessonId": 7, "hasFinished": False, "attendedAt":  datetime.now() },
-            {"lessonId": 8, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 23, 11, 15, 0),
-        "updatedAt": datetime(2023, 8, 23, 11, 15, 0)
-    },
-    {
-        "enrollmentId": 11,
-        "courseId": 5,
-        "studentId": 11,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 60,
-        "attendance": [
-            {"lessonId": 9, "hasFinished": True, "attendedAt": datetime(2023, 9, 6, 9, 45, 0)},
-            {"lessonId": 10, "hasFinished": True, "attendedAt": datetime(2023, 9, 8, 10, 0, 0)}
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 24, 10, 50, 0),
-        "updatedAt": datetime(2023, 9, 8, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 12,
-        "courseId": 6,
-        "studentId": 12,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 25,
-        "attendance": [
-            {"lessonId": 11, "hasFinished": True, "attendedAt": datetime(2023, 9, 7, 10, 0, 0)},
-            {"lessonId": 12, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 26, 9, 55, 0),
-        "updatedAt": datetime(2023, 9, 7, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 13,
-        "courseId": 7,
-        "studentId": 13,
-        "isActive": True,
-        "completionStatus": "not_started",
-        "trackProgress": 0,
-        "attendance": [
-            {"lessonId": 13, "hasFinished": False, "attendedAt":  datetime.now() },
-            {"lessonId": 14, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 27, 11, 0, 0),
-        "updatedAt": datetime(2023, 8, 27, 11, 0, 0)
-    },
-    {
-        "enrollmentId": 14,
-        "courseId": 7,
-        "studentId": 14,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 45,
-        "attendance": [
-            {"lessonId": 13, "hasFinished": True, "attendedAt": datetime(2023, 9, 8, 10, 0, 0)},
-            {"lessonId": 14, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 27, 11, 10, 0),
-        "updatedAt": datetime(2023, 9, 8, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 15,
-        "courseId": 8,
-        "studentId": 15,
-        "isActive": True,
-        "completionStatus": "completed",
-        "trackProgress": 100,
-        "attendance": [
-            {"lessonId": 15, "hasFinished": True, "attendedAt": datetime(2023, 8, 30, 10, 0, 0)},
-            {"lessonId": 16, "hasFinished": True, "attendedAt": datetime(2023, 9, 1, 10, 30, 0)}
-        ],
-        "completionDate": datetime(2023, 9, 2, 12, 0, 0),
-        "createdAt": datetime(2023, 8, 28, 12, 0, 0),
-        "updatedAt": datetime(2023, 9, 2, 12, 5, 0)
-    },
-    {
-        "enrollmentId": 16,
-        "courseId": 8,
-        "studentId": 16,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 30,
-        "attendance": [
-            {"lessonId": 15, "hasFinished": True, "attendedAt": datetime(2023, 9, 9, 10, 0, 0)},
-            {"lessonId": 16, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 28, 12, 10, 0),
-        "updatedAt": datetime(2023, 9, 9, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 17,
-        "courseId": 9,
-        "studentId": 6,
-        "isActive": True,
-        "completionStatus": "not_started",
-        "trackProgress": 0,
-        "attendance": [
-            {"lessonId": 17, "hasFinished": False, "attendedAt":  datetime.now() },
-            {"lessonId": 18, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 29, 11, 0, 0),
-        "updatedAt": datetime(2023, 8, 29, 11, 0, 0)
-    },
-    {
-        "enrollmentId": 18,
-        "courseId": 9,
-        "studentId": 8,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 50,
-        "attendance": [
-            {"lessonId": 17, "hasFinished": True, "attendedAt": datetime(2023, 9, 10, 10, 0, 0)},
-            {"lessonId": 18, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 29, 11, 10, 0),
-        "updatedAt": datetime(2023, 9, 10, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 19,
-        "courseId": 10,
-        "studentId": 13,
-        "isActive": True,
-        "completionStatus": "not_started",
-        "trackProgress": 0,
-        "attendance": [
-            {"lessonId": 19, "hasFinished": False, "attendedAt":  datetime.now() },
-            {"lessonId": 20, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 30, 10, 0, 0),
-        "updatedAt": datetime(2023, 8, 30, 10, 0, 0)
-    },
-    {
-        "enrollmentId": 20,
-        "courseId": 10,
-        "studentId": 21,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 35,
-        "attendance": [
-            {"lessonId": 19, "hasFinished": True, "attendedAt": datetime(2023, 9, 11, 10, 0, 0)},
-            {"lessonId": 20, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 30, 10, 10, 0),
-        "updatedAt": datetime(2023, 9, 11, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 21,
-        "courseId": 11,
-        "studentId": 21,
-        "isActive": True,
-        "completionStatus": "completed",
-        "trackProgress": 100,
-        "attendance": [
-            {"lessonId": 21, "hasFinished": True, "attendedAt": datetime(2023, 8, 31, 10, 0, 0)},
-            {"lessonId": 22, "hasFinished": True, "attendedAt": datetime(2023, 9, 2, 10, 30, 0)}
-        ],
-        "completionDate": datetime(2023, 9, 3, 12, 0, 0),
-        "createdAt": datetime(2023, 8, 31, 12, 0, 0),
-        "updatedAt": datetime(2023, 9, 3, 12, 5, 0)
-    },
-    {
-        "enrollmentId": 22,
-        "courseId": 11,
-        "studentId": 22,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 40,
-        "attendance": [
-            {"lessonId": 21, "hasFinished": True, "attendedAt": datetime(2023, 9, 12, 10, 0, 0)},
-            {"lessonId": 22, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 8, 31, 12, 10, 0),
-        "updatedAt": datetime(2023, 9, 12, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 23,
-        "courseId": 12,
-        "studentId": 23,
-        "isActive": True,
-        "completionStatus": "not_started",
-        "trackProgress": 0,
-        "attendance": [
-            {"lessonId": 23, "hasFinished": False, "attendedAt":  datetime.now() },
-            {"lessonId": 24, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 9, 1, 11, 0, 0),
-        "updatedAt": datetime(2023, 9, 1, 11, 0, 0)
-    },
-    {
-        "enrollmentId": 24,
-        "courseId": 12,
-        "studentId": 24,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 50,
-        "attendance": [
-            {"lessonId": 23, "hasFinished": True, "attendedAt": datetime(2023, 9, 13, 10, 0, 0)},
-            {"lessonId": 24, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 9, 1, 11, 10, 0),
-        "updatedAt": datetime(2023, 9, 13, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 25,
-        "courseId": 13,
-        "studentId": 25,
-        "isActive": True,
-        "completionStatus": "completed",
-        "trackProgress": 100,
-        "attendance": [
-            {"lessonId": 25, "hasFinished": True, "attendedAt": datetime(2023, 9, 1, 10, 0, 0)},
-            {"lessonId": 26, "hasFinished": True, "attendedAt": datetime(2023, 9, 3, 10, 30, 0)}
-        ],
-        "completionDate": datetime(2023, 9, 4, 12, 0, 0),
-        "createdAt": datetime(2023, 9, 1, 12, 0, 0),
-        "updatedAt": datetime(2023, 9, 4, 12, 5, 0)
-    },
-    {
-        "enrollmentId": 26,
-        "courseId": 13,
-        "studentId": 26,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 30,
-        "attendance": [
-            {"lessonId": 25, "hasFinished": True, "attendedAt": datetime(2023, 9, 14, 10, 0, 0)},
-            {"lessonId": 26, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 9, 1, 12, 10, 0),
-        "updatedAt": datetime(2023, 9, 14, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 27,
-        "courseId": 14,
-        "studentId": 27,
-        "isActive": True,
-        "completionStatus": "not_started",
-        "trackProgress": 0,
-        "attendance": [
-            {"lessonId": 27, "hasFinished": False, "attendedAt":  datetime.now() },
-            {"lessonId": 28, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 9, 2, 11, 0, 0),
-        "updatedAt": datetime(2023, 9, 2, 11, 0, 0)
-    },
-    {
-        "enrollmentId": 28,
-        "courseId": 14,
-        "studentId": 28,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 55,
-        "attendance": [
-            {"lessonId": 27, "hasFinished": True, "attendedAt": datetime(2023, 9, 15, 10, 0, 0)},
-            {"lessonId": 28, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 9, 2, 11, 10, 0),
-        "updatedAt": datetime(2023, 9, 15, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 29,
-        "courseId": 15,
-        "studentId": 29,
-        "isActive": True,
-        "completionStatus": "completed",
-        "trackProgress": 100,
-        "attendance": [
-            {"lessonId": 29, "hasFinished": True, "attendedAt": datetime(2023, 9, 2, 10, 0, 0)},
-            {"lessonId": 30, "hasFinished": True, "attendedAt": datetime(2023, 9, 4, 10, 30, 0)}
-        ],
-        "completionDate": datetime(2023, 9, 5, 12, 0, 0),
-        "createdAt": datetime(2023, 9, 2, 12, 0, 0),
-        "updatedAt": datetime(2023, 9, 5, 12, 5, 0)
-    },
-    {
-        "enrollmentId": 30,
-        "courseId": 15,
-        "studentId": 30,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 40,
-        "attendance": [
-            {"lessonId": 29, "hasFinished": True, "attendedAt": datetime(2023, 9, 16, 10, 0, 0)},
-            {"lessonId": 30, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 9, 2, 12, 10, 0),
-        "updatedAt": datetime(2023, 9, 16, 10, 5, 0)
-    },
-    {
-        "enrollmentId": 31,
-        "courseId": 16,
-        "studentId": 31,
-        "isActive": True,
-        "completionStatus": "not_started",
-        "trackProgress": 0,
-        "attendance": [
-            {"lessonId": 31, "hasFinished": False, "attendedAt":  datetime.now() },
-            {"lessonId": 32, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 9, 3, 11, 0, 0),
-        "updatedAt": datetime(2023, 9, 3, 11, 0, 0)
-    },
-    {
-        "enrollmentId": 32,
-        "courseId": 16,
-        "studentId": 32,
-        "isActive": True,
-        "completionStatus": "in_progress",
-        "trackProgress": 45,
-        "attendance": [
-            {"lessonId": 31, "hasFinished": True, "attendedAt": datetime(2023, 9, 17, 10, 0, 0)},
-            {"lessonId": 32, "hasFinished": False, "attendedAt":  datetime.now() }
-        ],
-        "completionDate": None,
-        "createdAt": datetime(2023, 9, 3, 11, 10, 0),
-        "updatedAt": datetime(2023, 9, 17, 10, 5, 0)
-    }
+    #enrollments of a course by completion status, e.g. the in_progress ones
+    IndexModel([("courseId", 1), ("completionStatus", 1)]),
+
+    #enrollments of a course sorted by last update
+    IndexModel([("courseId", 1), ("updatedAt", 1)]),
+
+    #removes soft-deleted enrollments once the retention period is over
+    IndexModel("deletedAt", expireAfterSeconds=SOFT_DELETE_RETENTION_SECONDS)
 ]
 
+LESSON_INDEXES = [
+    #each lesson has a unique lessonId
+    #prevents duplicate lessons with the same ID
+    IndexModel("lessonId", unique=True),
+
+    #lessons of a course
+    IndexModel("courseId"),
 
-# In[172]:
-
-
-lessons_data = [
-    {"lessonId": 1, "courseId": 1, "title": "Intro to Python", "description": "Python basics, syntax and setup.", "assignmentId": 1, "isActive": True, "createdAt": datetime(2023,1,1,10,0,0), "updatedAt": datetime(2023,1,1,10,0,0)},
-    {"lessonId": 2, "courseId": 1, "title": "Data Types and Variables", "description": "Understanding Python data types.", "assignmentId": 2, "isActive": True, "createdAt": datetime(2023,1,2,10,0,0), "updatedAt": datetime(2023,1,2,10,0,0)},
-    {"lessonId": 3, "courseId": 2, "title": "HTML Basics", "description": "Intro to HTML and structure of web pages.", "assignmentId": 3, "isActive": True, "createdAt": datetime(2023,1,3,10,0,0), "updatedAt": datetime(2023,1,3,10,0,0)},
-    {"lessonId": 4, "courseId": 2, "title": "CSS Basics", "description": "Styling web pages with CSS.", "assignmentId": 4, "isActive": True, "createdAt": datetime(2023,1,4,10,0,0), "updatedAt": datetime(2023,1,4,10,0,0)},
-    {"lessonId": 5, "courseId": 3, "title": "JavaScript Fundamentals", "description": "Variables, functions and events in JS.", "assignmentId": 5, "isActive": True, "createdAt": datetime(2023,1,5,10,0,0), "updatedAt": datetime(2023,1,5,10,0,0)},
-    {"lessonId": 6, "courseId": 3, "title": "DOM Manipulation", "description": "Selecting and modifying HTML elements.", "assignmentId": 6, "isActive": True, "createdAt": datetime(2023,1,6,10,0,0), "updatedAt": datetime(2023,1,6,10,0,0)},
-    {"lessonId": 7, "courseId": 4, "title": "SQL Basics", "description": "Introduction to SQL queries.", "assignmentId": 7, "isActive": True, "createdAt": datetime(2023,1,7,10,0,0), "updatedAt": datetime(2023,1,7,10,0,0)},
-    {"lessonId": 8, "courseId": 4, "title": "Joins and Aggregation", "description": "Advanced SQL queries.", "assignmentId": 8, "isActive": True, "createdAt": datetime(2023,1,8,10,0,0), "updatedAt": datetime(2023,1,8,10,0,0)},
-    {"lessonId": 9, "courseId": 5, "title": "Git Basics", "description": "Version control introduction.", "assignmentId": 9, "isActive": True, "createdAt": datetime(2023,1,9,10,0,0), "updatedAt": datetime(2023,1,9,10,0,0)},
-    {"lessonId": 10, "courseId": 5, "title": "Git Branching", "description": "Working with branches in Git.", "assignmentId": 10, "isActive": True, "createdAt": datetime(2023,1,10,10,0,0), "updatedAt": datetime(2023,1,10,10,0,0)},
-    {"lessonId": 11, "courseId": 6, "title": "Docker Introduction", "description": "Containers and Docker basics.", "assignmentId": 11, "isActive": True, "createdAt": datetime(2023,1,11,10,0,0), "updatedAt": datetime(2023,1,11,10,0,0)},
-    {"lessonId": 12, "courseId": 6, "title": "Docker Compose", "description": "Managing multi-container apps.", "assignmentId": 12, "isActive": True, "createdAt": datetime(2023,1,12,10,0,0), "updatedAt": datetime(2023,1,12,10,0,0)},
-    {"lessonId": 13, "courseId": 7, "title": "Python OOP", "description": "Object-oriented programming concepts.", "assignmentId": 13, "isActive": True, "createdAt": datetime(2023,1,13,10,0,0), "updatedAt": datetime(2023,1,13,10,0,0)},
-    {"lessonId": 14, "courseId": 7, "title": "Advanced OOP", "description": "Inheritance, polymorphism, and encapsulation.", "assignmentId": 14, "isActive": True, "createdAt": datetime(2023,1,14,10,0,0), "updatedAt": datetime(2023,1,14,10,0,0)},
-    {"lessonId": 15, "courseId": 8, "title": "REST APIs Intro", "description": "Building RESTful services.", "assignmentId": 15, "isActive": True, "createdAt": datetime(2023,1,15,10,0,0), "updatedAt": datetime(2023,1,15,10,0,0)},
-    {"lessonId": 16, "courseId": 8, "title": "API Security", "description": "Authentication and authorization.", "assignmentId": 16, "isActive": True, "createdAt": datetime(2023,1,16,10,0,0), "updatedAt": datetime(2023,1,16,10,0,0)},
-    {"lessonId": 17, "courseId": 9, "title": "Cloud Basics", "description": "Intro to cloud computing.", "assignmentId": 17, "isActive": True, "createdAt": datetime(2023,1,17,10,0,0), "updatedAt": datetime(2023,1,17,10,0,0)},
-    {"lessonId": 18, "courseId": 9, "title": "AWS Services", "description": "Core AWS services overview.", "assignmentId": 18, "isActive": True, "createdAt": datetime(2023,1,18,10,0,0), "updatedAt": datetime(2023,1,18,10,0,0)},
-    {"lessonId": 19, "courseId": 10, "title": "Kubernetes Intro", "description": "Containers orchestration basics.", "assignmentId": 19, "isActive": True, "createdAt": datetime(2023,1,19,10,0,0), "updatedAt": datetime(2023,1,19,10,0,0)},
-    {"lessonId": 20, "courseId": 10, "title": "K8s Deployments", "description": "Managing deployments in Kubernetes.", "assignmentId": 20, "isActive": True, "createdAt": datetime(2023,1,20,10,0,0), "updatedAt": datetime(2023,1,20,10,0,0)},
-    {"lessonId": 21, "courseId": 11, "title": "Data Analysis Intro", "description": "Analyzing data with Pandas.", "assignmentId": 21, "isActive": True, "createdAt": datetime(2023,1,21,10,0,0), "updatedAt": datetime(2023,1,21,10,0,0)},
-    {"lessonId": 22, "courseId": 11, "title": "Data Visualization", "description": "Creating charts with matplotlib.", "assignmentId": 22, "isActive": True, "createdAt": datetime(2023,1,22,10,0,0), "updatedAt": datetime(2023,1,22,10,0,0)},
-    {"lessonId": 23, "courseId": 12, "title": "Machine Learning Intro", "description": "Supervised and unsupervised learning.", "assignmentId": 23, "isActive": True, "createdAt": datetime(2023,1,23,10,0,0), "updatedAt": datetime(2023,1,23,10,0,0)},
-    {"lessonId": 24, "courseId": 12, "title": "ML Algorithms", "description": "Regression, classification, clustering.", "assignmentId": 24, "isActive": True, "createdAt": datetime(2023,1,24,10,0,0), "updatedAt": datetime(2023,1,24,10,0,0)},
-    {"lessonId": 25, "courseId": 13, "title": "Big Data Overview", "description": "Introduction to Big Data concepts.", "assignmentId": 25, "isActive": True, "createdAt": datetime(2023,1,25,10,0,0), "updatedAt": datetime(2023,1,25,10,0,0)},
-    {"lessonId": 26, "courseId": 13, "title": "Hadoop Basics", "description": "Hadoop ecosystem and architecture.", "assignmentId": 26, "isActive": True, "createdAt": datetime(2023,1,26,10,0,0), "updatedAt": datetime(2023,1,26,10,0,0)},
-    {"lessonId": 27, "courseId": 14, "title": "NoSQL Intro", "description": "Key concepts of NoSQL databases.", "assignmentId": 27, "isActive": True, "createdAt": datetime(2023,1,27,10,0,0), "updatedAt": datetime(2023,1,27,10,0,0)},
-    {"lessonId": 28, "courseId": 14, "title": "MongoDB Basics", "description": "CRUD operations and aggregation.", "assignmentId": 28, "isActive": True, "createdAt": datetime(2023,1,28,10,0,0), "updatedAt": datetime(2023,1,28,10,0,0)},
-    {"lessonId": 29, "courseId": 15, "title": "Python Data Science", "description": "Using Python for data analysis.", "assignmentId": 29, "isActive": True, "createdAt": datetime(2023,1,29,10,0,0), "updatedAt": datetime(2023,1,29,10,0,0)},
-    {"lessonId": 30, "courseId": 15, "title": "Data Science Project", "description": "Hands-on project for data science.", "assignmentId": 30, "isActive": True, "createdAt": datetime(2023,1,30,10,0,0), "updatedAt": datetime(2023,1,30,10,0,0)},
-    {"lessonId": 31, "courseId": 1, "title": "Python Functions", "description": "Defining and using functions in Python.", "assignmentId": 31, "isActive": True, "createdAt": datetime(2023,2,1,10,0,0), "updatedAt": datetime(2023,2,1,10,0,0)},
-    {"lessonId": 32, "courseId": 2, "title": "Forms in HTML", "description": "Creating interactive forms.", "assignmentId": 32, "isActive": True, "createdAt": datetime(2023,2,2,10,0,0), "updatedAt": datetime(2023,2,2,10,0,0)},
-    {"lessonId": 33, "courseId": 3, "title": "Events in JavaScript", "description": "Handling user interactions.", "assignmentId": 33, "isActive": True, "createdAt": datetime(2023,2,3,10,0,0), "updatedAt": datetime(2023,2,3,10,0,0)},
-    {"lessonId": 34, "courseId": 4, "title": "Indexes in SQL", "description": "Creating and using indexes for performance.", "assignmentId": 34, "isActive": True, "createdAt": datetime(2023,2,4,10,0,0), "updatedAt": datetime(2023,2,4,10,0,0)},
-    {"lessonId": 35, "courseId": 5, "title": "Git Merge Conflicts", "description": "Resolving conflicts in Git.", "assignmentId": 35, "isActive": True, "createdAt": datetime(2023,2,5,10,0,0), "updatedAt": datetime(2023,2,5,10,0,0)},
-    {"lessonId": 36, "courseId": 6, "title": "Docker Networking", "description": "Managing networks in Docker.", "assignmentId": 36, "isActive": True, "createdAt": datetime(2023,2,6,10,0,0), "updatedAt": datetime(2023,2,6,10,0,0)},
-    {"lessonId": 37, "courseId": 7, "title": "OOP Design Patterns", "description": "Common patterns in software design.", "assignmentId": 37, "isActive": True, "createdAt": datetime(2023,2,7,10,0,0), "updatedAt": datetime(2023,2,7,10,0,0)},
-    {"lessonId": 38, "courseId": 8, "title": "API Testing", "description": "Testing REST APIs with Postman.", "assignmentId": 38, "isActive": True, "createdAt": datetime(2023,2,8,10,0,0), "updatedAt": datetime(2023,2,8,10,0,0)},
-    {"lessonId": 39, "courseId": 9, "title": "Cloud Security", "description": "Best practices for securing cloud services.", "assignmentId": 39, "isActive": True, "createdAt": datetime(2023,2,9,10,0,0), "updatedAt": datetime(2023,2,9,10,0,0)},
-    {"lessonId": 40, "courseId": 10, "title": "Kubernetes Services", "description": "Exposing applications with services.", "assignmentId": 40, "isActive": True, "createdAt": datetime(2023,2,10,10,0,0), "updatedAt": datetime(2023,2,10,10,0,0)}
+    #removes soft-deleted lessons once the retention period is over
+    IndexModel("deletedAt", expireAfterSeconds=SOFT_DELETE_RETENTION_SECONDS)
 ]
 
+ASSIGNMENT_INDEXES = [
+    #each assignment has a unique assignmentId
+    #prevents duplicate assignments with the same ID
+    IndexModel("assignmentId", unique=True),
 
-# In[173]:
-
-
-assignments_data = [
-    {"assignmentId": 1, "lessonId": 1, "courseId": 1, "title": "Python Setup Assignment", "description": "Install Python and run your first script.", "dueDate": datetime(2023,1,5,23,59,0), "isActive": True, "createdAt": datetime(2023,1,1,10,0,0), "updatedAt": datetime(2023,1,1,10,0,0)},
-    {"assignmentId": 2, "lessonId": 2, "courseId": 1, "title": "Variables and Data Types", "description": "Create variables of different types.", "dueDate": datetime(2023,1,6,23,59,0), "isActive": True, "createdAt": datetime(2023,1,2,10,0,0), "updatedAt": datetime(2023,1,2,10,0,0)},
-    {"assignmentId": 3, "lessonId": 3, "courseId": 2, "title": "HTML Structure Assignment", "description": "Build a basic HTML page with headings and paragraphs.", "dueDate": datetime(2023,1,7,23,59,0), "isActive": True, "createdAt": datetime(2023,1,3,10,0,0), "updatedAt": datetime(2023,1,3,10,0,0)},
-    {"assignmentId": 4, "lessonId": 4, "courseId": 2, "title": "CSS Styling Assignment", "description": "Style your HTML page using CSS.", "dueDate": datetime(2023,1,8,23,59,0), "isActive": True, "createdAt": datetime(2023,1,4,10,0,0), "updatedAt": datetime(2023,1,4,10,0,0)},
-    {"assignmentId": 5, "lessonId": 5, "courseId": 3, "title": "JavaScript Functions", "description": "Write JS functions to handle basic operations.", "dueDate": datetime(2023,1,9,23,59,0), "isActive": True, "createdAt": datetime(2023,1,5,10,0,0), "updatedAt": datetime(2023,1,5,10,0,0)},
-    {"assignmentId": 6, "lessonId": 6, "courseId": 3, "title": "DOM Manipulation Task", "description": "Change HTML content using JS DOM methods.", "dueDate": datetime(2023,1,10,23,59,0), "isActive": True, "createdAt": datetime(2023,1,6,10,0,0), "updatedAt": datetime(2023,1,6,10,0,0)},
-    {"assignmentId": 7, "lessonId": 7, "courseId": 4, "title": "Basic SQL Queries", "description": "Write SELECT queries to fetch data from tables.", "dueDate": datetime(2023,1,11,23,59,0), "isActive": True, "createdAt": datetime(2023,1,7,10,0,0), "updatedAt": datetime(2023,1,7,10,0,0)},
-    {"assignmentId": 8, "lessonId": 8, "courseId": 4, "title": "SQL Joins Assignment", "description": "Use INNER, LEFT, and RIGHT joins on sample tables.", "dueDate": datetime(2023,1,12,23,59,0), "isActive": True, "createdAt": datetime(2023,1,8,10,0,0), "updatedAt": datetime(2023,1,8,10,0,0)},
-    {"assignmentId": 9, "lessonId": 9, "courseId": 5, "title": "Git Init and Commit", "description": "Initialize a repo and make your first commits.", "dueDate": datetime(2023,1,13,23,59,0), "isActive": True, "createdAt": datetime(2023,1,9,10,0,0), "updatedAt": datetime(2023,1,9,10,0,0)},
-    {"assignmentId": 10, "lessonId": 10, "courseId": 5, "title": "Git Branching Exercise", "description": "Create and merge branches in Git.", "dueDate": datetime(2023,1,14,23,59,0), "isActive": True, "createdAt": datetime(2023,1,10,10,0,0), "updatedAt": datetime(2023,1,10,10,0,0)},
-    {"assignmentId": 11, "lessonId": 11, "courseId": 6, "title": "Dockerfile Creation", "description": "Create a Dockerfile and build an image.", "dueDate": datetime(2023,1,15,23,59,0), "isActive": True, "createdAt": datetime(2023,1,11,10,0,0), "updatedAt": datetime(2023,1,11,10,0,0)},
-    {"assignmentId": 12, "lessonId": 12, "courseId": 6, "title": "Docker Compose File", "description": "Set up a multi-container application using Docker Compose.", "dueDate": datetime(2023,1,16,23,59,0), "isActive": True, "createdAt": datetime(2023,1,12,10,0,0), "updatedAt": datetime(2023,1,12,10,0,0)},
-    {"assignmentId": 13, "lessonId": 13, "courseId": 7, "title": "OOP Class Design", "description": "Design classes using inheritance and encapsulation.", "dueDate": datetime(2023,1,17,23,59,0), "isActive": True, "createdAt": datetime(2023,1,13,10,0,0), "updatedAt": datetime(2023,1,13,10,0,0)},
-    {"assignmentId": 14, "lessonId": 14, "courseId": 7, "title": "Polymorphism Exercise", "description": "Implement polymorphism in a small program.", "dueDate": datetime(2023,1,18,23,59,0), "isActive": True, "createdAt": datetime(2023,1,14,10,0,0), "updatedAt": datetime(2023,1,14,10,0,0)},
-    {"assignmentId": 15, "lessonId": 15, "courseId": 8, "title": "API REST Assignment", "description": "Build a simple REST API with GET and POST endpoints.", "dueDate": datetime(2023,1,19,23,59,0), "isActive": True, "createdAt": datetime(2023,1,15,10,0,0), "updatedAt": datetime(2023,1,15,10,0,0)}
+    #assignments of a lesson
+    IndexModel("lessonId"),
+
+    #assignments by due date, Part 5 index 3
+    #(also serves the assignments due next week query)
+    IndexModel("dueDate")
 ]
 
+SUBMISSION_INDEXES = [
+    #each submission has a unique submissionId
+    #prevents duplicate submissions with the same ID
+    IndexModel("submissionId", unique=True),
+
+    #submissions for a given assignment, per enrollment (submissions
+    #reference the student through their enrollmentId)
+    IndexModel([("assignmentId", 1), ("enrollmentId", 1)]),
 
-# In[174]:
-
-
-submissions_data = [
-    {"submissionId":1,"enrollmentId":1,"assignmentId":1,"submittedAt":datetime(2023,1,5,22,0,0),"feedback":"Good work","grade":95,"createdAt":datetime(2023,1,5,22,10,0),"updatedAt":datetime(2023,1,5,22,10,0)},
-    {"submissionId":2,"enrollmentId":2,"assignmentId":1,"submittedAt":datetime(2023,1,5,21,30,0),"feedback":"Well done","grade":90,"createdAt":datetime(2023,1,5,21,35,0),"updatedAt":datetime(2023,1,5,21,35,0)},
-    {"submissionId":3,"enrollmentId":1,"assignmentId":2,"submittedAt":datetime(2023,1,6,23,0,0),"feedback":"Excellent","grade":98,"createdAt":datetime(2023,1,6,23,5,0),"updatedAt":datetime(2023,1,6,23,5,0)},
-    {"submissionId":4,"enrollmentId":3,"assignmentId":3,"submittedAt":datetime(2023,1,7,20,30,0),"feedback":"Good start","grade":88,"createdAt":datetime(2023,1,7,20,35,0),"updatedAt":datetime(2023,1,7,20,35,0)},
-    {"submissionId":5,"enrollmentId":2,"assignmentId":2,"submittedAt":datetime(2023,1,6,22,45,0),"feedback":"Nice work","grade":92,"createdAt":datetime(2023,1,6,22,50,0),"updatedAt":datetime(2023,1,6,22,50,0)},
-    {"submissionId":6,"enrollmentId":4,"assignmentId":4,"submittedAt":datetime(2023,1,8,19,0,0),"feedback":"Check styling","grade":85,"createdAt":datetime(2023,1,8,19,5,0),"updatedAt":datetime(2023,1,8,19,5,0)},
-    {"submissionId":7,"enrollmentId":1,"assignmentId":3,"submittedAt":datetime(2023,1,7,21,0,0),"feedback":"Good","grade":90,"createdAt":datetime(2023,1,7,21,5,0),"updatedAt":datetime(2023,1,7,21,5,0)},
-    {"submissionId":8,"enrollmentId":5,"assignmentId":5,"submittedAt":datetime(2023,1,9,22,15,0),"feedback":"Well implemented","grade":93,"createdAt":datetime(2023,1,9,22,20,0),"updatedAt":datetime(2023,1,9,22,20,0)},
-    {"submissionId":9,"enrollmentId":3,"assignmentId":4,"submittedAt":datetime(2023,1,8,21,30,0),"feedback":"Good CSS","grade":89,"createdAt":datetime(2023,1,8,21,35,0),"updatedAt":datetime(2023,1,8,21,35,0)},
-    {"submissionId":10,"enrollmentId":6,"assignmentId":6,"submittedAt":datetime(2023,1,10,20,45,0),"feedback":"Excellent","grade":97,"createdAt":datetime(2023,1,10,20,50,0),"updatedAt":datetime(2023,1,10,20,50,0)},
-    {"submissionId":11,"enrollmentId":4,"assignmentId":5,"submittedAt":datetime(2023,1,9,21,0,0),"feedback":"Nice logic","grade":91,"createdAt":datetime(2023,1,9,21,5,0),"updatedAt":datetime(2023,1,9,21,5,0)},
-    {"submissionId":12,"enrollmentId":2,"assignmentId":6,"submittedAt":datetime(2023,1,10,22,0,0),"feedback":"Well done","grade":94,"createdAt":datetime(2023,1,10,22,5,0),"updatedAt":datetime(2023,1,10,22,5,0)},
-    {"submissionId":13,"enrollmentId":1,"assignmentId":7,"submittedAt":datetime(2023,1,11,20,0,0),"feedback":"SQL queries fine","grade":96,"createdAt":datetime(2023,1,11,20,5,0),"updatedAt":datetime(2023,1,11,20,5,0)},
-    {"submissionId":14,"enrollmentId":5,"assignmentId":7,"submittedAt":datetime(2023,1,11,21,15,0),"feedback":"Great work","grade":95,"createdAt":datetime(2023,1,11,21,20,0),"updatedAt":datetime(2023,1,11,21,20,0)},
-    {"submissionId":15,"enrollmentId":6,"assignmentId":8,"submittedAt":datetime(2023,1,12,20,30,0),"feedback":"Correct joins","grade":92,"createdAt":datetime(2023,1,12,20,35,0),"updatedAt":datetime(2023,1,12,20,35,0)},
-    {"submissionId":16,"enrollmentId":3,"assignmentId":8,"submittedAt":datetime(2023,1,12,19,50,0),"feedback":"Well done","grade":90,"createdAt":datetime(2023,1,12,19,55,0),"updatedAt":datetime(2023,1,12,19,55,0)},
-    {"submissionId":17,"enrollmentId":4,"assignmentId":9,"submittedAt":datetime(2023,1,13,22,0,0),"feedback":"Good repo setup","grade":94,"createdAt":datetime(2023,1,13,22,5,0),"updatedAt":datetime(2023,1,13,22,5,0)},
-    {"submissionId":18,"enrollmentId":5,"assignmentId":10,"submittedAt":datetime(2023,1,14,20,30,0),"feedback":"Branches correct","grade":93,"createdAt":datetime(2023,1,14,20,35,0),"updatedAt":datetime(2023,1,14,20,35,0)},
-    {"submissionId":19,"enrollmentId":1,"assignmentId":11,"submittedAt":datetime(2023,1,15,21,0,0),"feedback":"Dockerfile ok","grade":95,"createdAt":datetime(2023,1,15,21,5,0),"updatedAt":datetime(2023,1,15,21,5,0)},
-    {"submissionId":20,"enrollmentId":6,"assignmentId":12,"submittedAt":datetime(2023,1,16,22,0,0),"feedback":"Compose setup fine","grade":96,"createdAt":datetime(2023,1,16,22,5,0),"updatedAt":datetime(2023,1,16,22,5,0)}
+    #submissions of an enrollment, used by the average grade aggregation
+    IndexModel("enrollmentId")
 ]
 
+#collection name -> its indexes
+COLLECTION_INDEXES = {
+    user_collection: USER_INDEXES,
+    course_collection: COURSE_INDEXES,
+    enrollment_collection: ENROLLMENT_INDEXES,
+    lesson_collection: LESSON_INDEXES,
+    assignment_collection: ASSIGNMENT_INDEXES,
+    submission_collection: SUBMISSION_INDEXES,
+
+    #one progress summary per course
+    course_progress_collection: [IndexModel("courseId", unique=True)],
+
+    #one attendance record per enrollment and lesson
+    attendance_collection: [IndexModel([("enrollmentId", 1), ("lessonId", 1)], unique=True)],
+}
+
+
+#indexes created by earlier versions of this script that conflict with the
+#ones above and are dropped before creating them: the (title text, category)
+#course index, since a collection can only have one text index
+LEGACY_INDEXES = {
+    course_collection: ["title_text_category_1"],
+}
+
+
+def ensure_indexes(db):
+    """
+    Create the indexes of every collection (COLLECTION_INDEXES).
+
+    Each collection gets all its indexes in a single createIndexes command,
+    and the commands of the different collections are sent concurrently,
+    so the builds run on the server at the same time. Indexes that already
+    exist are left as they are, and the legacy indexes (LEGACY_INDEXES)
+    still present are dropped first, so it is safe to call on every start.
+
+    Parameters:
+        db (Database): The MongoDB database instance.
+
+    Returns:
+        dict: Names of the indexes per collection (empty list on error).
+    """
+    def create(collection_name, indexes):
+        try:
+            collection = db[collection_name]
+            legacy_indexes = LEGACY_INDEXES.get(collection_name)
+            if legacy_indexes:
+                existing_indexes = collection.index_information()
+                for index_name in legacy_indexes:
+                    if index_name in existing_indexes:
+                        collection.drop_index(index_name)
+            return collection_name, collection.create_indexes(indexes)
+        except Exception as e:
+            print(f"Error creating indexes of '{collection_name}': {e}")
+            return collection_name, []
+
+    with ThreadPoolExecutor(max_workers=len(COLLECTION_INDEXES)) as executor:
+        return dict(executor.map(lambda pair: create(*pair), COLLECTION_INDEXES.items()))
+
+
+ensure_indexes(db)
+
 
 # In[ ]:
 
@@ -1110,12 +1312,126 @@ submissions_data = [
 ##Part 2: Data Population
 #Task 2.1: Insert Sample Data
 
-create_documents(db, user_collection, users_data, "userId")
-create_documents(db, course_collection, courses_data, "courseId")
-create_documents(db, enrollment_collection, enrollments_data, "enrollmentId")
-create_documents(db, lesson_collection, lessons_data, "lessonId")
-create_documents(db, assignment_collection, assignments_data, "assignmentId")
-create_documents(db, submission_collection, submissions_data, "submissionId")
+#(collection name, id field, sample data list in eduhub_seed_data, whether
+#the id field has its own sequence in 'counters') to insert
+#the documents come from the eduhub_db.<collection>.bson files when they exist
+seed_data = [
+    (user_collection, "userId", "users_data", True),
+    (course_collection, "courseId", "courses_data", True),
+    (enrollment_collection, "enrollmentId", "enrollment_documents", True),
+    (lesson_collection, "lessonId", "lessons_data", True),
+    (assignment_collection, "assignmentId", "assignments_data", True),
+    (submission_collection, "submissionId", "submissions_data", True),
+    #keyed by the ID of another collection, no sequence of their own
+    (course_progress_collection, "courseId", "course_progress_rollup", False),
+    (attendance_collection, "enrollmentId", "attendance_data", False),
+]
+
+
+def bulk_seed(db, collection_name, documents, id_field, write_concern=WriteConcern(w=0)):
+    """
+    Insert sample documents into one collection.
+
+    Only meant for loading sample data: the documents go out in unordered
+    bulk inserts (batches of up to 1000 documents) and by default the
+    inserts are not acknowledged, since the load is a one-shot and the CRUD
+    helpers keep the client's acknowledged write concern. Documents are
+    checked with the collection's compiled validator first. Acknowledged
+    inserts then bypass the server-side validation; unacknowledged ones
+    cannot, so the server validates them as usual (switching validation
+    off and on around them is not safe, as the collMod commands may
+    overtake inserts sent on other connections of the pool).
+
+    Parameters:
+        db (Database): The MongoDB database instance.
+        collection_name (str): Name of the collection.
+        documents (list): Documents to insert.
+        id_field (str): Name of the ID field, used in error messages.
+        write_concern (WriteConcern): Write concern of the inserts.
+
+    Returns:
+        int: Number of documents sent (not confirmed by the server when
+             the inserts are unacknowledged).
+    """
+    bypass = write_concern is None or write_concern.acknowledged
+    inserted_ids = create_documents(db, collection_name, documents, id_field, write_concern,
+                                    schema_validators.get(collection_name),
+                                    bypass_document_validation=bypass)
+    return len(inserted_ids)
+
+
+def wait_for_documents(db, expected_counts, timeout=10, interval=0.1):
+    """
+    Wait until each collection holds at least the expected number of documents.
+
+    Used after unacknowledged inserts: the client does not wait for them,
+    and they may still be in flight on other connections of the pool, so
+    the next operations could otherwise miss documents. Documents the
+    server rejected never show up, so the wait gives up after timeout
+    seconds.
+
+    Parameters:
+        db (Database): The MongoDB database object.
+        expected_counts (dict): Minimum number of documents per collection name.
+        timeout (float): Maximum number of seconds to wait.
+        interval (float): Seconds between two checks.
+
+    Returns:
+        bool: True if every collection reached its expected count.
+              False on timeout or if an exception occurs.
+    """
+    try:
+        deadline = time.monotonic() + timeout
+        pending = dict(expected_counts)
+        while pending:
+            # Acknowledged reads, drop the collections that are complete
+            pending = {name: count for name, count in pending.items()
+                       if get_collection(db, name).count_documents({}) < count}
+            if not pending:
+                break
+            if time.monotonic() >= deadline:
+                print(f"Documents still missing after {timeout} s in: {', '.join(pending)}")
+                return False
+            time.sleep(interval)
+        return True
+
+    except Exception as e:
+        # Print error message and return False if any error occurs
+        print(f"Error while waiting for documents: {e}")
+        return False
+
+
+def seed_sample_data(db, write_concern=WriteConcern(w=0)):
+    """
+    Insert the sample documents of every collection (see bulk_seed), then
+    move the ID counters past the sample IDs (see sync_counter).
+
+    When the inserts are unacknowledged, waits until the documents are in
+    the collections (see wait_for_documents) before returning, so the
+    operations that follow see the sample data.
+
+    Returns:
+        dict: Number of documents sent per collection (not confirmed by
+              the server when the inserts are unacknowledged).
+    """
+    sent = {}
+    for collection_name, id_field, data_name, has_sequence in seed_data:
+        documents = load_seed_documents(collection_name, data_name)
+        sent[collection_name] = bulk_seed(db, collection_name, documents, id_field, write_concern)
+
+        # Move the ID sequence past the IDs used by the sample data
+        if has_sequence:
+            sync_counter(db, collection_name, id_field, documents)
+
+    # Barrier before Part 3: the unacknowledged inserts must have landed
+    if write_concern is not None and not write_concern.acknowledged:
+        wait_for_documents(db, sent)
+
+    return sent
+
+
+sent = seed_sample_data(db)
+print(f"Sample documents sent (unacknowledged): {sent}")
 
 
 # In[186]:
@@ -1125,14 +1441,18 @@ create_documents(db, submission_collection, submissions_data, "submissionId")
 # Task 3.1: Create Operations
 # 1. Add a new student user
 
+#timestamp of this operation, taken once and shared by all its
+#timestamp fields (in UTC, the time zone MongoDB stores dates in)
+now = datetime.now(timezone.utc)
+
 # Define a new student document with required information
 new_user = {
-    "userId": get_next_id(db, user_collection, "userId"), #generate a new unique userId
+    "userId": get_next_id(db, user_collection), #generate a new unique userId
     "firstName": "antonio",                 
     "lastName": "furtado",                  
     "email": "antonio.student@example.com",   
     "role": "student",                    
-    "joinedAt": datetime.now()      #Timestamp of when the student joined
+    "joinedAt": now      #Timestamp of when the student joined
 }
 
 #insert the new student document into the 'user_collection'
@@ -1147,10 +1467,12 @@ print(result)
 
 # 2. Create a new course
 
+now = datetime.now(timezone.utc)
+
 # Define a new course document with all necessary details
 new_course = {
 
-    "courseId": get_next_id(db, course_collection, "courseId"), #Generate a unique courseId
+    "courseId": get_next_id(db, course_collection), #Generate a unique courseId
     "title": "Advanced Python Programming",  # Course title
     "description": "Deep dive into Python for real-world applications.",  
     "instructorId": 17,                      
@@ -1162,7 +1484,7 @@ new_course = {
     "isPublished": True,                      
     "isActive": True,                         
     "reviewRate": 0.0,                        
-    "createdAt": datetime.now()        #Timestamp of creation
+    "createdAt": now        #Timestamp of creation
 }
 
 # Insert the new course document into the course_collection
@@ -1177,9 +1499,11 @@ print(result)
 
 # 3. Enroll a student in a course
 
+now = datetime.now(timezone.utc)
+
 # Define a new enrollment document linking a student to a course
 new_enrollment = {
-    "enrollmentId": get_next_id(db, enrollment_collection, "enrollmentId"),      
+    "enrollmentId": get_next_id(db, enrollment_collection),      
 
     "courseId": 21,             # ID of the course the student is enrolling in
     "studentId": 31,            # ID of the student being enrolled
@@ -1188,22 +1512,19 @@ new_enrollment = {
     "completionStatus": "not_started",  
     "trackProgress": 0,         
 
-    # Attendance list stores each lesson's status for the student
-    "attendance": [             
-        {
-            "lessonId": 1,          
-            "hasFinished": False,   
-            "attendedAt": datetime.now()  
-        }
-    ],
-
     "completionDate": None,     
-    "createdAt": datetime.now() 
+    "createdAt": now 
 }
 
 # Insert the new enrollment document into the 'enrollment_collection'
 result = create_document(db, enrollment_collection, new_enrollment)
 
+# Count the new enrollment in the course's progress roll-up
+if result:
+    update_course_progress(db, new_enrollment["courseId"],
+                           new_status=new_enrollment["completionStatus"],
+                           progress_delta=new_enrollment["trackProgress"])
+
 # Print the result to verify insertion success
 print(result)
 
@@ -1213,16 +1534,18 @@ print(result)
 
 # 4. Add a new lesson to an existing course
 
+now = datetime.now(timezone.utc)
+
 # Define a new lesson document that belongs to a specific course
 new_lesson = {
-    "lessonId": get_next_id(db, lesson_collection, "lessonId"),
+    "lessonId": get_next_id(db, lesson_collection),
     "courseId": 21,               #ID of the course this lesson belongs to
 
     "title": "Advanced Python Functions",  # Title of the lesson
     "description": "Deep dive into functions, closures, and decorators in Python.",                                 
     "assignmentId": 12,           
     "isActive": True,              
-    "createdAt": datetime.now() 
+    "createdAt": now 
 }
 
 # Insert the new lesson document into the 'lesson_collection'
@@ -1231,6 +1554,19 @@ result = create_document(db, lesson_collection, new_lesson)
 print(result)
 
 
+# In[214]:
+
+
+# 5. Record the new student starting the new lesson
+
+#the attendance goes to the attendance collection, one record per
+#enrollment and lesson; the lesson is started but not finished yet
+result = record_attendance(db, new_enrollment["enrollmentId"], new_lesson["lessonId"],
+                           has_finished=False)
+
+print(result)
+
+
 # In[117]:
 
 
@@ -1248,8 +1584,12 @@ query = {
     "isActive": True     #include users who are active
 }
 
+#only return fields stored in the (role, isActive, firstName, lastName, email)
+#index, so the query is covered by the index
+projection = {"_id": 0, "firstName": 1, "lastName": 1, "email": 1, "role": 1, "isActive": 1}
+
 # Execute the read operation on the user_collection with the specified query
-result = read_document(db, user_collection, query)
+result = read_document(db, user_collection, query, projection)
 
 #print each active student
 for active_student in result:
@@ -1284,11 +1624,20 @@ for course in result:
 category = "Programming"
 result = ""
 
-#query to find all courses where "category" matches 
+#query to find all courses where "category" matches
 query = {"category": category}
 
 result = read_document(db, course_collection, query)
 
+for course in result:
+    print(course)
+
+#published catalogue: only the published and active courses in the category
+#(the conditions of the partial category index, so the query can use it)
+catalogue_query = {"category": category, "isPublished": True, "isActive": True}
+
+result = read_document(db, course_collection, catalogue_query)
+
 for course in result:
     print(course)
 
@@ -1312,17 +1661,28 @@ for enrollment in result:
 # In[195]:
 
 
-#5. Search courses by title (case-insensitive, partial match)
+#5. Search courses by title (case-insensitive, prefix match)
 
-# search term to match in course titles
+# search term to match at the start of course titles
 search_title = "aWs"
 result = ""
 
-#query using a regular expression ($regex)
-#$options ->i makes the search case-insensitive
-query = {"title": {"$regex": search_title, "$options": "i"}}
-
-result = read_document(db, course_collection, query)
+#titles from the search term up to the last title starting with it
+#compared with the case-insensitive collation of the title_ci index (see
+#Part 5), so the matching titles are read from that index instead of
+#scanning every course ($regex does not use collations)
+#this range only bounds a prefix for ASCII search terms: with other
+#characters the collation may treat letters as equal to several others
+#(e.g. "ß" and "ss"), so those terms use an anchored case-insensitive
+#$regex instead, which reads every course
+#to find a word anywhere in the title use the text index instead:
+#{"$text": {"$search": search_title}}
+if search_title.isascii():
+    query = {"title": {"$gte": search_title, "$lt": search_title + "\uffff"}}
+    result = read_document(db, course_collection, query, collation=CASE_INSENSITIVE)
+else:
+    query = {"title": {"$regex": f"^{re.escape(search_title)}", "$options": "i"}}
+    result = read_document(db, course_collection, query)
 
 for course in result:
     print(course)
@@ -1353,16 +1713,19 @@ new_profile = {
 #query to find the user document with the given userId to be update
 query = {"userId": user_id}
 
-#the update object using MongoDB's $set operator
-#sets the new profile data in the user's document and updates the updatedAt timestamp
-update_data = {
+#the update object: an update pipeline with MongoDB's $set stage
+#sets the new profile data in the user's document and updates the updatedAt
+#timestamp with the server's clock ($$NOW)
+#$literal keeps the values as they are (a string starting with "$" would
+#otherwise be read as a field path)
+update_data = [{
     "$set": {
-        "profile.bio": new_profile.get("bio"),
-        "profile.avatar": new_profile.get("avatar"),
-        "profile.skills": new_profile.get("skills"),
-        "updatedAt": datetime.now()
+        "profile.bio": {"$literal": new_profile.get("bio")},
+        "profile.avatar": {"$literal": new_profile.get("avatar")},
+        "profile.skills": {"$literal": new_profile.get("skills")},
+        "updatedAt": "$$NOW"
     }
-}
+}]
 
 result = update_document(db, user_collection, query, update_data)
 
@@ -1379,12 +1742,12 @@ result = ""
 query = {"courseId":1}
 
 #will set the 'isPublished' field to True and update the 'updatedAt' timestamp
-update_data = {
+update_data = [{
     "$set": {
         "isPublished": True,          #mark the course as published
-        "updatedAt": datetime.now()  
+        "updatedAt": "$$NOW"          #server time of the update
     }
-}
+}]
 
 result = update_document(db, course_collection, query, update_data)
 
@@ -1407,12 +1770,12 @@ submissionId = 1
 query = {"submissionId": submissionId}
 
 #sets the new grade value and updates the 'updatedAt' timestamp
-update_data = {
+update_data = [{
     "$set": {
         "grade": grade_value,        
-        "updatedAt": datetime.now()
+        "updatedAt": "$$NOW"          #server time of the update
     }
-}
+}]
 
 result = update_document(db, submission_collection, query, update_data)
 
@@ -1431,15 +1794,9 @@ courseId = 1
 #the new tags to add
 new_tags = ["backend"]
 
-query = {"courseId": courseId}
-
-#the update object
-update_data = {
-    "$addToSet": {"tags": {"$each": new_tags}},  #add new tags uniquely
-    "$set": {"updatedAt": datetime.now()}       
-}
-
-result = update_document(db, course_collection, query, update_data)
+#merge the new tags into the course's tags (without duplicates) on the
+#client, the course is only written if a tag is actually new
+result = add_course_tags(db, courseId, new_tags)
 
 print(f"Number of documents updated {result}")
 
@@ -1476,9 +1833,8 @@ print(f"Number of documents deleted {result}")
 result = ""
 enrollmentId = 1
 
-document_query = {"enrollmentId": enrollmentId}
-
-result = delete_document(db, enrollment_collection, document_query)
+#soft delete, also removing the enrollment from its course's progress roll-up
+result = delete_enrollment(db, enrollmentId)
 
 print(f"Number of documents deleted {result}")
 
@@ -1530,8 +1886,8 @@ for course in result:
 
 result = ""
 
-#calculate date for 6 month ago approximating 6 months as 180 days
-six_months_ago = datetime.now() - timedelta(days=6*30)
+#calculate the date 6 calendar months ago, computed once before the query
+six_months_ago = months_ago(6)
 
 document_query = {"joinedAt": {"$gte": six_months_ago}}
 
@@ -1569,10 +1925,11 @@ for course in result:
 result = ""
 
 # Calculate the date 7 days from now 
-next_week = datetime.now() + timedelta(days=7)
+now = datetime.now(timezone.utc)
+next_week = now + timedelta(days=7)
 
 #will match assignments due within the next 7 days
-document_query = {"dueDate": {"$gte": datetime.now(), "$lte": next_week}}
+document_query = {"dueDate": {"$gte": now, "$lte": next_week}}
 
 result = read_document(db, assignment_collection, document_query)
 
@@ -1591,27 +1948,9 @@ for assignment in result:
 
 # 1. Course Enrollment Statistics
 # 1.1 Count total enrollments per course
+#(ENROLLMENTS_PER_COURSE_PIPELINE, run together with 1.2 below)
 result = ""
 
-#Get the enrollment collection from the database
-enrollments = db[enrollment_collection]
-
-#the aggregation pipeline
-pipeline = [
-    {
-        # $group stage aggregates documents by a specified key
-        "$group": {
-            "_id": "$courseId",                #group by 'courseId'
-            "totalEnrollments": {"$sum": 1}   #count each document in the group
-        }
-    }
-]
-
-results = enrollments.aggregate(pipeline)
-
-for result in results:
-    print(f"courseId: {result['_id']}, total enrollments: {result['totalEnrollments']}")
-
 
 # In[207]:
 
@@ -1619,23 +1958,18 @@ for result in results:
 # 1.2-Calculate average course rating
 # Group by course category
 result = ""
-course = db[course_collection]
 
-pipeline = [
-    {
-        "$group": {
-            "_id": "$category",               # group by course category
-            "averageRating": {"$avg": "$reviewRate"}  #average rating per category
-        }
-    },
-    {
-        "$sort": {"averageRating": -1}      #sort by highest rating
-    }
-]
+#the two statistics read different collections, so both aggregations are
+#sent at the same time on the pooled client instead of one after the other
+enrollment_stats, rating_stats = run_aggregations(db, [
+    (enrollment_collection, ENROLLMENTS_PER_COURSE_PIPELINE),
+    (course_collection, RATING_PER_CATEGORY_PIPELINE)
+])
 
-result = list(course.aggregate(pipeline))
+for result in enrollment_stats:
+    print(f"courseId: {result['_id']}, total enrollments: {result['totalEnrollments']}")
 
-for statistic in result:
+for statistic in rating_stats:
     print(f"category: {statistic['_id']}, avg rating: {statistic['averageRating']:.2f}")
 
 
@@ -1651,33 +1985,9 @@ for statistic in result:
 
 # 1.Average grade per student
 result = ""
-enrollment = db[enrollment_collection]
-
-pipeline = [
-    {
-        "$lookup": {
-            "from": "submission",       #submission collection with grades
-            "localField": "enrollmentId", 
-            "foreignField": "enrollmentId",
-            "as": "submissions"
-        }
-    },
-    {
-        "$unwind": "$submissions"     #flat the submissions array
-    },
-    {
-        "$group": {
-            "_id": "$studentId",      #group by student
-            "averageGrade": { "$avg": "$submissions.grade" }
-        }
-    },
-    {
-        "$sort": { "averageGrade": -1 } #highest first
-    }
-]
-
+submission = db[submission_collection]
 
-result = list(enrollment.aggregate(pipeline))
+result = list(submission.aggregate(AVERAGE_GRADE_PER_STUDENT_PIPELINE))
 for res in result:
     print(f"studentId: {res['_id']}, average grade: {res['averageGrade']:.2f}")
 
@@ -1692,10 +2002,8 @@ for res in result:
 
 
 # 1-User email lookup
-user = db[user_collection]
-
 #unique=True ensures no duplicate emails
-user.create_index("email", unique=True)
+#created with the other user indexes by ensure_indexes() (USER_INDEXES)
 
 
 # In[211]:
@@ -1703,10 +2011,12 @@ user.create_index("email", unique=True)
 
 # 2-Course search by title and category 
 
-course = db[course_collection]
-
-#compound index
-course.create_index([("title", "text"), ("category", 1)])
+#text index on title alone, used by $text searches, and a case-insensitive
+#title index for prefix searches (Read Operation 5)
+#category lookups are served by the (category, difficultyLevel) index and,
+#for published and active courses, by the partial category index; a text
+#key in front of category would not help them
+#created with the other course indexes by ensure_indexes() (COURSE_INDEXES)
 
 
 # In[212]:
@@ -1714,9 +2024,7 @@ course.create_index([("title", "text"), ("category", 1)])
 
 # 3-Assignment queries by due date
 
-assignment = db[assignment_collection]
-
-assignment.create_index("dueDate")
+#created with the other assignment indexes by ensure_indexes() (ASSIGNMENT_INDEXES)
 
 
 # In[213]:
@@ -1724,7 +2032,5 @@ assignment.create_index("dueDate")
 
 # 4-Assignment queries by due date
 
-enrollment = db[enrollment_collection]
-
-enrollment.create_index([("studentId", 1), ("courseId", 1)])
-
+#(studentId, courseId) enrollment index, for the enrollments of a student
+#created with the other enrollment indexes by ensure_indexes() (ENROLLMENT_INDEXES)
@@ -0,0 +1,643 @@
+# Sample data for the EduHub database
+# ------------------------------------------------------------
+# Documents inserted by Part 2 of eduhub_mongodb_project.py.
+# They live in their own module so that the large literals are only
+# built when the sample data is actually needed (i.e. when the
+# eduhub_db.<collection>.bson files do not exist yet).
+#
+# Run this module to (re)generate those BSON files in the data folder:
+#     python src/eduhub_seed_data.py
+
+from array import array
+import bson
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+
+users_data = [
+    {"userId": 1, "email": "alice.student@example.com", "firstName": "Alice", "lastName": "Johnson", "role": "student",
+     "joinedAt": datetime(2023, 1, 15, 10, 0, 0), "profile": {"bio": "Loves learning Python", "avatar": "", "skills": ["Python", "Data Analysis"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 20, 12, 0, 0)},
+    {"userId": 2, "email": "bob.student@example.com", "firstName": "Bob", "lastName": "Smith", "role": "student",
+     "joinedAt": datetime(2023, 2, 10, 9, 30, 0), "profile": {"bio": "Front-end enthusiast", "avatar": "", "skills": ["HTML", "CSS", "JavaScript"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 18, 11, 0, 0)},
+    {"userId": 3, "email": "carol.student@example.com", "firstName": "Carol", "lastName": "Davis", "role": "student",
+     "joinedAt": datetime(2023, 3, 1, 8, 45, 0), "profile": {"bio": "Data Science beginner", "avatar": "", "skills": ["Python", "Statistics"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 15, 10, 0, 0)},
+    {"userId": 4, "email": "david.student@example.com", "firstName": "David", "lastName": "Wilson", "role": "student",
+     "joinedAt": datetime(2023, 1, 20, 10, 15, 0), "profile": {"bio": "AI hobbyist", "avatar": "", "skills": ["Python", "Machine Learning"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 19, 9, 30, 0)},
+    {"userId": 5, "email": "emma.student@example.com", "firstName": "Emma", "lastName": "Taylor", "role": "student",
+     "joinedAt": datetime(2023, 2, 25, 11, 0, 0), "profile": {"bio": "Web developer in training", "avatar": "", "skills": ["HTML", "CSS"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 15, 0)},
+    {"userId": 6, "email": "frank.student@example.com", "firstName": "Frank", "lastName": "Anderson", "role": "student",
+     "joinedAt": datetime(2023, 3, 10, 9, 30, 0), "profile": {"bio": "Interested in DevOps", "avatar": "", "skills": ["Docker", "Kubernetes"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 20, 11, 45, 0)},
+    {"userId": 7, "email": "grace.student@example.com", "firstName": "Grace", "lastName": "Thomas", "role": "student",
+     "joinedAt": datetime(2023, 1, 28, 10, 0, 0), "profile": {"bio": "Learning backend development", "avatar": "", "skills": ["Node.js", "Express"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 19, 10, 30, 0)},
+    {"userId": 8, "email": "henry.student@example.com", "firstName": "Henry", "lastName": "Moore", "role": "student",
+     "joinedAt": datetime(2023, 2, 5, 9, 0, 0), "profile": {"bio": "Database enthusiast", "avatar": "", "skills": ["SQL", "PostgreSQL"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 18, 11, 15, 0)},
+    {"userId": 9, "email": "isabel.student@example.com", "firstName": "Isabel", "lastName": "Martin", "role": "student",
+     "joinedAt": datetime(2023, 3, 12, 8, 30, 0), "profile": {"bio": "Learning AI", "avatar": "", "skills": ["Python", "TensorFlow"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 21, 9, 50, 0)},
+    {"userId": 10, "email": "jack.student@example.com", "firstName": "Jack", "lastName": "Lee", "role": "student",
+     "joinedAt": datetime(2023, 1, 18, 10, 20, 0), "profile": {"bio": "Cloud computing beginner", "avatar": "", "skills": ["AWS", "Azure"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 40, 0)},
+    {"userId": 11, "email": "kate.student@example.com", "firstName": "Kate", "lastName": "Perez", "role": "student",
+     "joinedAt": datetime(2023, 2, 22, 11, 10, 0), "profile": {"bio": "Cybersecurity enthusiast", "avatar": "", "skills": ["Network Security", "Linux"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 19, 12, 0, 0)},
+    {"userId": 12, "email": "leo.student@example.com", "firstName": "Leo", "lastName": "Harris", "role": "student",
+     "joinedAt": datetime(2023, 3, 5, 9, 50, 0), "profile": {"bio": "Loves Python scripting", "avatar": "", "skills": ["Python", "Automation"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 18, 10, 20, 0)},
+    {"userId": 13, "email": "mia.student@example.com", "firstName": "Mia", "lastName": "Clark", "role": "student",
+     "joinedAt": datetime(2023, 1, 30, 10, 5, 0), "profile": {"bio": "Full-stack web developer", "avatar": "", "skills": ["React", "Node.js"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 21, 11, 10, 0)},
+    {"userId": 14, "email": "nick.student@example.com", "firstName": "Nick", "lastName": "Lewis", "role": "student",
+     "joinedAt": datetime(2023, 2, 12, 9, 40, 0), "profile": {"bio": "Interested in DevOps", "avatar": "", "skills": ["Docker", "CI/CD"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 20, 12, 30, 0)},
+    {"userId": 15, "email": "olivia.student@example.com", "firstName": "Olivia", "lastName": "Walker", "role": "student",
+     "joinedAt": datetime(2023, 3, 7, 8, 50, 0), "profile": {"bio": "Learning Data Science", "avatar": "", "skills": ["Python", "Pandas"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 19, 10, 50, 0)},
+    {"userId": 16, "email": "paul.student@example.com", "firstName": "Paul", "lastName": "Hall", "role": "student",
+     "joinedAt": datetime(2023, 1, 25, 10, 30, 0), "profile": {"bio": "Interested in AI", "avatar": "", "skills": ["Python", "Keras"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 10, 0)},
+    {"userId": 17, "email": "queen.instructor@example.com", "firstName": "Queen", "lastName": "Allen", "role": "instructor",
+     "joinedAt": datetime(2022, 12, 10, 9, 0, 0), "profile": {"bio": "Expert in Python", "avatar": "", "skills": ["Python", "Data Science"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 15, 12, 0, 0)},
+    {"userId": 18, "email": "roger.instructor@example.com", "firstName": "Roger", "lastName": "Young", "role": "instructor",
+     "joinedAt": datetime(2022, 11, 5, 8, 30, 0), "profile": {"bio": "Web development instructor", "avatar": "", "skills": ["HTML", "CSS", "JavaScript"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 18, 11, 40, 0)},
+    {"userId": 19, "email": "sophia.instructor@example.com", "firstName": "Sophia", "lastName": "King", "role": "instructor",
+     "joinedAt": datetime(2022, 12, 15, 9, 15, 0), "profile": {"bio": "AI and ML instructor", "avatar": "", "skills": ["Python", "Machine Learning"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 30, 0)},
+    {"userId": 20, "email": "tom.instructor@example.com", "firstName": "Tom", "lastName": "Scott", "role": "instructor",
+     "joinedAt": datetime(2022, 12, 20, 8, 45, 0), "profile": {"bio": "Cloud computing instructor", "avatar": "", "skills": ["AWS", "Azure"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 21, 11, 50, 0)},
+    {"userId": 21, "email": "uma.student@example.com", "firstName": "Uma", "lastName": "Adams", "role": "student",
+     "joinedAt": datetime(2023, 2, 1, 10, 10, 0), "profile": {"bio": "Learning front-end", "avatar": "", "skills": ["React", "CSS"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 20, 0)},
+    {"userId": 22, "email": "victor.student@example.com", "firstName": "Victor", "lastName": "Baker", "role": "student",
+     "joinedAt": datetime(2023, 2, 18, 9, 35, 0), "profile": {"bio": "Backend beginner", "avatar": "", "skills": ["Node.js", "Express"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 19, 11, 15, 0)},
+    {"userId": 23, "email": "wendy.student@example.com", "firstName": "Wendy", "lastName": "Carter", "role": "student",
+     "joinedAt": datetime(2023, 3, 3, 8, 55, 0), "profile": {"bio": "Learning DevOps", "avatar": "", "skills": ["Docker", "Kubernetes"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 40, 0)},
+    {"userId": 24, "email": "xander.student@example.com", "firstName": "Xander", "lastName": "Evans", "role": "student",
+     "joinedAt": datetime(2023, 1, 27, 10, 20, 0), "profile": {"bio": "Database learner", "avatar": "", "skills": ["SQL", "PostgreSQL"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 18, 10, 50, 0)},
+    {"userId": 25, "email": "yara.student@example.com", "firstName": "Yara", "lastName": "Foster", "role": "student",
+     "joinedAt": datetime(2023, 2, 8, 9, 50, 0), "profile": {"bio": "Learning AI", "avatar": "", "skills": ["Python", "TensorFlow"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 20, 11, 25, 0)},
+    {"userId": 26, "email": "zane.student@example.com", "firstName": "Zane", "lastName": "Green", "role": "student",
+     "joinedAt": datetime(2023, 3, 11, 8, 40, 0), "profile": {"bio": "Python and ML beginner", "avatar": "", "skills": ["Python", "ML"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 5, 0)},
+    {"userId": 27, "email": "amy.student@example.com", "firstName": "Amy", "lastName": "Hughes", "role": "student",
+     "joinedAt": datetime(2023, 1, 19, 10, 5, 0), "profile": {"bio": "Interested in cybersecurity", "avatar": "", "skills": ["Network Security", "Linux"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 35, 0)},
+    {"userId": 28, "email": "brian.student@example.com", "firstName": "Brian", "lastName": "Irwin", "role": "student",
+     "joinedAt": datetime(2023, 2, 28, 9, 20, 0), "profile": {"bio": "Learning cloud computing", "avatar": "", "skills": ["AWS", "Azure"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 19, 11, 55, 0)},
+    {"userId": 29, "email": "chloe.student@example.com", "firstName": "Chloe", "lastName": "Jones", "role": "student",
+     "joinedAt": datetime(2023, 3, 6, 8, 50, 0), "profile": {"bio": "Data science enthusiast", "avatar": "", "skills": ["Python", "Pandas"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 30, 0)},
+    {"userId": 30, "email": "daniel.student@example.com", "firstName": "Daniel", "lastName": "Kelly", "role": "student",
+     "joinedAt": datetime(2023, 1, 23, 10, 25, 0), "profile": {"bio": "Interested in AI and ML", "avatar": "", "skills": ["Python", "Keras"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 20, 10, 55, 0)},
+    {"userId": 31, "email": "ella.student@example.com", "firstName": "Ella", "lastName": "Lopez", "role": "student",
+     "joinedAt": datetime(2023, 2, 14, 9, 40, 0), "profile": {"bio": "Front-end learner", "avatar": "", "skills": ["HTML", "CSS", "React"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 19, 11, 10, 0)},
+    {"userId": 32, "email": "fred.student@example.com", "firstName": "Fred", "lastName": "Morris", "role": "student",
+     "joinedAt": datetime(2023, 3, 9, 8, 35, 0), "profile": {"bio": "Learning backend development", "avatar": "", "skills": ["Node.js", "Express"]},
+     "isActive": True, "updatedAt": datetime(2023, 9, 21, 12, 20, 0)}
+]
+
+
+courses_data = [
+    {"courseId": 1, "title": "Introduction to Python", "description": "Learn the basics of Python programming.",
+     "instructorId": 17, "category": "Programming", "difficultyLevel": "beginner", "duration": 20, "price": 49.99,
+     "tags": ["python", "programming", "basics"], "isPublished": True, "isActive": True, "reviewRate": 4.5,
+     "createdAt": datetime(2023, 1, 10, 9, 0, 0), "updatedAt": datetime(2023, 5, 1, 12, 0, 0)},
+    {"courseId": 2, "title": "Advanced Python", "description": "Master advanced Python concepts and best practices.",
+     "instructorId": 18, "category": "Programming", "difficultyLevel": "advanced", "duration": 35, "price": 99.99,
+     "tags": ["python", "advanced", "OOP"], "isPublished": True, "isActive": True, "reviewRate": 4.8,
+     "createdAt": datetime(2023, 2, 15, 10, 0, 0), "updatedAt": datetime(2023, 6, 20, 14, 0, 0)},
+    {"courseId": 3, "title": "Data Science Basics", "description": "Introduction to data science, statistics, and visualization.",
+     "instructorId": 19, "category": "Data Science", "difficultyLevel": "beginner", "duration": 25, "price": 59.99,
+     "tags": ["data science", "statistics", "visualization"], "isPublished": True, "isActive": True, "reviewRate": 4.6,
+     "createdAt": datetime(2023, 3, 1, 11, 0, 0), "updatedAt": datetime(2023, 6, 15, 12, 0, 0)},
+    {"courseId": 4, "title": "Machine Learning A-Z", "description": "Learn machine learning algorithms from scratch.",
+     "instructorId": 20, "category": "Data Science", "difficultyLevel": "intermidiate", "duration": 40, "price": 129.99,
+     "tags": ["machine learning", "python", "AI"], "isPublished": True, "isActive": True, "reviewRate": 4.7,
+     "createdAt": datetime(2023, 3, 10, 9, 0, 0), "updatedAt": datetime(2023, 7, 1, 15, 0, 0)},
+    {"courseId": 5, "title": "Web Development with HTML, CSS, JS",
+     "description": "Build interactive websites using HTML, CSS, and JavaScript.",
+     "instructorId": 17, "category": "Web Development", "difficultyLevel": "beginner", "duration": 30, "price": 79.99,
+     "tags": ["web", "html", "css", "javascript"], "isPublished": True, "isActive": True, "reviewRate": 4.3,
+     "createdAt": datetime(2023, 1, 20, 8, 0, 0), "updatedAt": datetime(2023, 5, 25, 13, 0, 0)},
+    {"courseId": 6, "title": "React for Beginners", "description": "Learn how to build dynamic front-end applications using React.",
+     "instructorId": 18, "category": "Web Development", "difficultyLevel": "beginner", "duration": 28, "price": 89.99,
+     "tags": ["react", "javascript", "frontend"], "isPublished": True, "isActive": True, "reviewRate": 4.4,
+     "createdAt": datetime(2023, 2, 5, 10, 30, 0), "updatedAt": datetime(2023, 6, 5, 12, 30, 0)},
+    {"courseId": 7, "title": "Node.js and Express", "description": "Server-side development with Node.js and Express.",
+     "instructorId": 19, "category": "Backend Development", "difficultyLevel": "intermidiate", "duration": 32, "price": 99.99,
+     "tags": ["nodejs", "express", "backend"], "isPublished": True, "isActive": True, "reviewRate": 4.5,
+     "createdAt": datetime(2023, 3, 1, 9, 30, 0), "updatedAt": datetime(2023, 7, 10, 14, 0, 0)},
+    {"courseId": 8, "title": "Docker Essentials", "description": "Learn containerization concepts and Docker fundamentals.",
+     "instructorId": 20, "category": "DevOps", "difficultyLevel": "beginner", "duration": 18, "price": 59.99,
+     "tags": ["docker", "containers", "devops"], "isPublished": True, "isActive": True, "reviewRate": 4.2,
+     "createdAt": datetime(2023, 1, 25, 11, 0, 0), "updatedAt": datetime(2023, 5, 30, 13, 30, 0)},
+    {"courseId": 9, "title": "Kubernetes for Beginners", "description": "Introduction to Kubernetes and container orchestration.",
+     "instructorId": 17, "category": "DevOps", "difficultyLevel": "intermidiate", "duration": 25, "price": 79.99,
+     "tags": ["kubernetes", "containers", "orchestration"], "isPublished": True, "isActive": True, "reviewRate": 4.3,
+     "createdAt": datetime(2023, 2, 15, 9, 45, 0), "updatedAt": datetime(2023, 6, 20, 12, 30, 0)},
+    {"courseId": 10, "title": "SQL for Beginners", "description": "Learn to query databases using SQL.",
+     "instructorId": 18, "category": "Database", "difficultyLevel": "beginner", "duration": 20, "price": 49.99,
+     "tags": ["sql", "database", "query"], "isPublished": True, "isActive": True, "reviewRate": 4.4,
+     "createdAt": datetime(2023, 1, 12, 8, 30, 0), "updatedAt": datetime(2023, 5, 15, 11, 0, 0)},
+    {"courseId": 11, "title": "PostgreSQL Advanced", "description": "Advanced PostgreSQL features and optimization techniques.",
+     "instructorId": 19, "category": "Database", "difficultyLevel": "advanced", "duration": 30, "price": 99.99,
+     "tags": ["postgresql", "database", "advanced"], "isPublished": True, "isActive": True, "reviewRate": 4.6,
+     "createdAt": datetime(2023, 3, 1, 10, 0, 0), "updatedAt": datetime(2023, 6, 25, 14, 0, 0)},
+    {"courseId": 12, "title": "Introduction to AI", "description": "Basic concepts and applications of Artificial Intelligence.",
+     "instructorId": 20, "category": "AI", "difficultyLevel": "beginner", "duration": 22, "price": 69.99,
+     "tags": ["AI", "artificial intelligence", "machine learning"], "isPublished": True, "isActive": True, "reviewRate": 4.3,
+     "createdAt": datetime(2023, 2, 1, 11, 0, 0), "updatedAt": datetime(2023, 6, 5, 12, 0, 0)},
+    {"courseId": 13, "title": "Advanced AI Techniques", "description": "Deep dive into AI algorithms and neural networks.",
+     "instructorId": 17, "category": "AI", "difficultyLevel": "advanced", "duration": 40, "price": 149.99,
+     "tags": ["AI", "neural networks", "deep learning"], "isPublished": True, "isActive": True, "reviewRate": 4.7,
+     "createdAt": datetime(2023, 3, 15, 9, 0, 0), "updatedAt": datetime(2023, 7, 5, 14, 0, 0)},
+    {"courseId": 14, "title": "Cloud Computing Basics", "description": "Learn the fundamentals of cloud services and architecture.",
+     "instructorId": 18, "category": "Cloud", "difficultyLevel": "beginner", "duration": 18, "price": 59.99,
+     "tags": ["cloud", "AWS", "azure", "basics"], "isPublished": True, "isActive": True, "reviewRate": 4.2,
+     "createdAt": datetime(2023, 1, 28, 10, 0, 0), "updatedAt": datetime(2023, 6, 1, 12, 0, 0)},
+    {"courseId": 15, "title": "AWS Certified Solutions Architect",
+     "description": "Prepare for AWS certification with hands-on labs and examples.", "instructorId": 19,
+     "category": "Cloud", "difficultyLevel": "intermidiate", "duration": 35, "price": 129.99,
+     "tags": ["AWS", "cloud", "certification"], "isPublished": True, "isActive": True, "reviewRate": 4.6,
+     "createdAt": datetime(2023, 2, 10, 9, 30, 0), "updatedAt": datetime(2023, 6, 20, 14, 0, 0)},
+    {"courseId": 16, "title": "Cybersecurity Fundamentals", "description": "Introduction to cybersecurity concepts and practices.",
+     "instructorId": 20, "category": "Security", "difficultyLevel": "beginner", "duration": 25, "price": 79.99,
+     "tags": ["cybersecurity", "security", "basics"], "isPublished": True, "isActive": True, "reviewRate": 4.4,
+     "createdAt": datetime(2023, 3, 1, 10, 30, 0), "updatedAt": datetime(2023, 7, 1, 15, 30, 0)}
+]
+
+
+#single timestamp (module import time, UTC) for the lessons that are not
+#attended yet, taken once instead of once per attendance entry so every
+#entry shares the same value
+_IMPORT_NOW = datetime.now(timezone.utc)
+
+
+def _mk_enroll(enrollment_id, course_id, student_id, status, progress, attendance,
+               created_at, updated_at, completion_date=None):
+    """
+    Expand one row of _ENROLL_ROWS into a full enrollment document.
+
+    attendance holds (lessonId, attendedAt) pairs; attendedAt is None for a
+    lesson that is not finished yet, which is recorded at _IMPORT_NOW.
+    Called once lessons_data is indexed, see enrollments_data below.
+    """
+    return {
+        "enrollmentId": enrollment_id,
+        "courseId": course_id,
+        "studentId": student_id,
+        "isActive": True,
+        "completionStatus": status,
+        "trackProgress": progress,
+        "attendance": tuple(
+            _stub(lesson_id) if attended_at is None else _attended(lesson_id, attended_at)
+            for lesson_id, attended_at in attendance
+        ),
+        "completionDate": completion_date,
+        "createdAt": created_at,
+        "updatedAt": updated_at
+    }
+
+
+_ENROLL_ROWS = [
+    # (enrollmentId, courseId, studentId, completionStatus, trackProgress,
+    #  ((lessonId, attendedAt or None if not finished), ...), createdAt, updatedAt, completionDate)
+    # not_started enrollments have no attendance yet: their attendance is empty
+    (1, 1, 1, "in_progress", 20, ((1, datetime(2023, 9, 1, 10, 0, 0)), (2, None)), datetime(2023, 8, 20, 12, 0, 0), datetime(2023, 9, 1, 10, 5, 0), None),
+    (2, 2, 2, "in_progress", 50, ((3, datetime(2023, 9, 2, 11, 0, 0)), (4, datetime(2023, 9, 5, 11, 0, 0))), datetime(2023, 8, 22, 9, 0, 0), datetime(2023, 9, 5, 12, 0, 0), None),
+    (3, 3, 3, "not_started", 0, (), datetime(2023, 8, 25, 10, 30, 0), datetime(2023, 8, 25, 10, 30, 0), None),
+    (4, 1, 4, "completed", 100, ((1, datetime(2023, 8, 28, 9, 0, 0)), (2, datetime(2023, 8, 30, 9, 30, 0))), datetime(2023, 8, 20, 12, 10, 0), datetime(2023, 8, 31, 12, 5, 0), datetime(2023, 8, 31, 12, 0, 0)),
+    (5, 4, 5, "in_progress", 30, ((7, datetime(2023, 9, 3, 10, 0, 0)), (8, None)), datetime(2023, 8, 23, 11, 0, 0), datetime(2023, 9, 3, 10, 5, 0), None),
+    (6, 2, 6, "in_progress", 40, ((3, datetime(2023, 9, 4, 9, 30, 0)), (4, None)), datetime(2023, 8, 22, 9, 15, 0), datetime(2023, 9, 4, 9, 35, 0), None),
+    (7, 5, 7, "not_started", 0, (), datetime(2023, 8, 24, 10, 45, 0), datetime(2023, 8, 24, 10, 45, 0), None),
+    (8, 3, 8, "completed", 100, ((5, datetime(2023, 8, 29, 10, 0, 0)), (6, datetime(2023, 9, 1, 10, 30, 0))), datetime(2023, 8, 25, 10, 35, 0), datetime(2023, 9, 2, 12, 5, 0), datetime(2023, 9, 2, 12, 0, 0)),
+    (9, 6, 9, "in_progress", 15, ((11, datetime(2023, 9, 5, 10, 0, 0)), (12, None)), datetime(2023, 8, 26, 9, 50, 0), datetime(2023, 9, 5, 10, 5, 0), None),
+    (10, 4, 10, "not_started", 0, (), datetime(2023, 8, 23, 11, 15, 0), datetime(2023, 8, 23, 11, 15, 0), None),
+    (11, 5, 11, "in_progress", 60, ((9, datetime(2023, 9, 6, 9, 45, 0)), (10, datetime(2023, 9, 8, 10, 0, 0))), datetime(2023, 8, 24, 10, 50, 0), datetime(2023, 9, 8, 10, 5, 0), None),
+    (12, 6, 12, "in_progress", 25, ((11, datetime(2023, 9, 7, 10, 0, 0)), (12, None)), datetime(2023, 8, 26, 9, 55, 0), datetime(2023, 9, 7, 10, 5, 0), None),
+    (13, 7, 13, "not_started", 0, (), datetime(2023, 8, 27, 11, 0, 0), datetime(2023, 8, 27, 11, 0, 0), None),
+    (14, 7, 14, "in_progress", 45, ((13, datetime(2023, 9, 8, 10, 0, 0)), (14, None)), datetime(2023, 8, 27, 11, 10, 0), datetime(2023, 9, 8, 10, 5, 0), None),
+    (15, 8, 15, "completed", 100, ((15, datetime(2023, 8, 30, 10, 0, 0)), (16, datetime(2023, 9, 1, 10, 30, 0))), datetime(2023, 8, 28, 12, 0, 0), datetime(2023, 9, 2, 12, 5, 0), datetime(2023, 9, 2, 12, 0, 0)),
+    (16, 8, 16, "in_progress", 30, ((15, datetime(2023, 9, 9, 10, 0, 0)), (16, None)), datetime(2023, 8, 28, 12, 10, 0), datetime(2023, 9, 9, 10, 5, 0), None),
+    (17, 9, 6, "not_started", 0, (), datetime(2023, 8, 29, 11, 0, 0), datetime(2023, 8, 29, 11, 0, 0), None),
+    (18, 9, 8, "in_progress", 50, ((17, datetime(2023, 9, 10, 10, 0, 0)), (18, None)), datetime(2023, 8, 29, 11, 10, 0), datetime(2023, 9, 10, 10, 5, 0), None),
+    (19, 10, 13, "not_started", 0, (), datetime(2023, 8, 30, 10, 0, 0), datetime(2023, 8, 30, 10, 0, 0), None),
+    (20, 10, 21, "in_progress", 35, ((19, datetime(2023, 9, 11, 10, 0, 0)), (20, None)), datetime(2023, 8, 30, 10, 10, 0), datetime(2023, 9, 11, 10, 5, 0), None),
+    (21, 11, 21, "completed", 100, ((21, datetime(2023, 8, 31, 10, 0, 0)), (22, datetime(2023, 9, 2, 10, 30, 0))), datetime(2023, 8, 31, 12, 0, 0), datetime(2023, 9, 3, 12, 5, 0), datetime(2023, 9, 3, 12, 0, 0)),
+    (22, 11, 22, "in_progress", 40, ((21, datetime(2023, 9, 12, 10, 0, 0)), (22, None)), datetime(2023, 8, 31, 12, 10, 0), datetime(2023, 9, 12, 10, 5, 0), None),
+    (23, 12, 23, "not_started", 0, (), datetime(2023, 9, 1, 11, 0, 0), datetime(2023, 9, 1, 11, 0, 0), None),
+    (24, 12, 24, "in_progress", 50, ((23, datetime(2023, 9, 13, 10, 0, 0)), (24, None)), datetime(2023, 9, 1, 11, 10, 0), datetime(2023, 9, 13, 10, 5, 0), None),
+    (25, 13, 25, "completed", 100, ((25, datetime(2023, 9, 1, 10, 0, 0)), (26, datetime(2023, 9, 3, 10, 30, 0))), datetime(2023, 9, 1, 12, 0, 0), datetime(2023, 9, 4, 12, 5, 0), datetime(2023, 9, 4, 12, 0, 0)),
+    (26, 13, 26, "in_progress", 30, ((25, datetime(2023, 9, 14, 10, 0, 0)), (26, None)), datetime(2023, 9, 1, 12, 10, 0), datetime(2023, 9, 14, 10, 5, 0), None),
+    (27, 14, 27, "not_started", 0, (), datetime(2023, 9, 2, 11, 0, 0), datetime(2023, 9, 2, 11, 0, 0), None),
+    (28, 14, 28, "in_progress", 55, ((27, datetime(2023, 9, 15, 10, 0, 0)), (28, None)), datetime(2023, 9, 2, 11, 10, 0), datetime(2023, 9, 15, 10, 5, 0), None),
+    (29, 15, 29, "completed", 100, ((29, datetime(2023, 9, 2, 10, 0, 0)), (30, datetime(2023, 9, 4, 10, 30, 0))), datetime(2023, 9, 2, 12, 0, 0), datetime(2023, 9, 5, 12, 5, 0), datetime(2023, 9, 5, 12, 0, 0)),
+    (30, 15, 30, "in_progress", 40, ((29, datetime(2023, 9, 16, 10, 0, 0)), (30, None)), datetime(2023, 9, 2, 12, 10, 0), datetime(2023, 9, 16, 10, 5, 0), None),
+    (31, 16, 31, "not_started", 0, (), datetime(2023, 9, 3, 11, 0, 0), datetime(2023, 9, 3, 11, 0, 0), None),
+    (32, 16, 32, "in_progress", 45, ((31, datetime(2023, 9, 17, 10, 0, 0)), (32, None)), datetime(2023, 9, 3, 11, 10, 0), datetime(2023, 9, 17, 10, 5, 0), None),
+]
+
+
+lessons_data = [
+    {"lessonId": 1, "courseId": 1, "title": "Intro to Python", "description": "Python basics, syntax and setup.", "assignmentId": 1, "isActive": True, "createdAt": datetime(2023,1,1,10,0,0), "updatedAt": datetime(2023,1,1,10,0,0)},
+    {"lessonId": 2, "courseId": 1, "title": "Data Types and Variables", "description": "Understanding Python data types.", "assignmentId": 2, "isActive": True, "createdAt": datetime(2023,1,2,10,0,0), "updatedAt": datetime(2023,1,2,10,0,0)},
+    {"lessonId": 3, "courseId": 2, "title": "HTML Basics", "description": "Intro to HTML and structure of web pages.", "assignmentId": 3, "isActive": True, "createdAt": datetime(2023,1,3,10,0,0), "updatedAt": datetime(2023,1,3,10,0,0)},
+    {"lessonId": 4, "courseId": 2, "title": "CSS Basics", "description": "Styling web pages with CSS.", "assignmentId": 4, "isActive": True, "createdAt": datetime(2023,1,4,10,0,0), "updatedAt": datetime(2023,1,4,10,0,0)},
+    {"lessonId": 5, "courseId": 3, "title": "JavaScript Fundamentals", "description": "Variables, functions and events in JS.", "assignmentId": 5, "isActive": True, "createdAt": datetime(2023,1,5,10,0,0), "updatedAt": datetime(2023,1,5,10,0,0)},
+    {"lessonId": 6, "courseId": 3, "title": "DOM Manipulation", "description": "Selecting and modifying HTML elements.", "assignmentId": 6, "isActive": True, "createdAt": datetime(2023,1,6,10,0,0), "updatedAt": datetime(2023,1,6,10,0,0)},
+    {"lessonId": 7, "courseId": 4, "title": "SQL Basics", "description": "Introduction to SQL queries.", "assignmentId": 7, "isActive": True, "createdAt": datetime(2023,1,7,10,0,0), "updatedAt": datetime(2023,1,7,10,0,0)},
+    {"lessonId": 8, "courseId": 4, "title": "Joins and Aggregation", "description": "Advanced SQL queries.", "assignmentId": 8, "isActive": True, "createdAt": datetime(2023,1,8,10,0,0), "updatedAt": datetime(2023,1,8,10,0,0)},
+    {"lessonId": 9, "courseId": 5, "title": "Git Basics", "description": "Version control introduction.", "assignmentId": 9, "isActive": True, "createdAt": datetime(2023,1,9,10,0,0), "updatedAt": datetime(2023,1,9,10,0,0)},
+    {"lessonId": 10, "courseId": 5, "title": "Git Branching", "description": "Working with branches in Git.", "assignmentId": 10, "isActive": True, "createdAt": datetime(2023,1,10,10,0,0), "updatedAt": datetime(2023,1,10,10,0,0)},
+    {"lessonId": 11, "courseId": 6, "title": "Docker Introduction", "description": "Containers and Docker basics.", "assignmentId": 11, "isActive": True, "createdAt": datetime(2023,1,11,10,0,0), "updatedAt": datetime(2023,1,11,10,0,0)},
+    {"lessonId": 12, "courseId": 6, "title": "Docker Compose", "description": "Managing multi-container apps.", "assignmentId": 12, "isActive": True, "createdAt": datetime(2023,1,12,10,0,0), "updatedAt": datetime(2023,1,12,10,0,0)},
+    {"lessonId": 13, "courseId": 7, "title": "Python OOP", "description": "Object-oriented programming concepts.", "assignmentId": 13, "isActive": True, "createdAt": datetime(2023,1,13,10,0,0), "updatedAt": datetime(2023,1,13,10,0,0)},
+    {"lessonId": 14, "courseId": 7, "title": "Advanced OOP", "description": "Inheritance, polymorphism, and encapsulation.", "assignmentId": 14, "isActive": True, "createdAt": datetime(2023,1,14,10,0,0), "updatedAt": datetime(2023,1,14,10,0,0)},
+    {"lessonId": 15, "courseId": 8, "title": "REST APIs Intro", "description": "Building RESTful services.", "assignmentId": 15, "isActive": True, "createdAt": datetime(2023,1,15,10,0,0), "updatedAt": datetime(2023,1,15,10,0,0)},
+    {"lessonId": 16, "courseId": 8, "title": "API Security", "description": "Authentication and authorization.", "assignmentId": 16, "isActive": True, "createdAt": datetime(2023,1,16,10,0,0), "updatedAt": datetime(2023,1,16,10,0,0)},
+    {"lessonId": 17, "courseId": 9, "title": "Cloud Basics", "description": "Intro to cloud computing.", "assignmentId": 17, "isActive": True, "createdAt": datetime(2023,1,17,10,0,0), "updatedAt": datetime(2023,1,17,10,0,0)},
+    {"lessonId": 18, "courseId": 9, "title": "AWS Services", "description": "Core AWS services overview.", "assignmentId": 18, "isActive": True, "createdAt": datetime(2023,1,18,10,0,0), "updatedAt": datetime(2023,1,18,10,0,0)},
+    {"lessonId": 19, "courseId": 10, "title": "Kubernetes Intro", "description": "Containers orchestration basics.", "assignmentId": 19, "isActive": True, "createdAt": datetime(2023,1,19,10,0,0), "updatedAt": datetime(2023,1,19,10,0,0)},
+    {"lessonId": 20, "courseId": 10, "title": "K8s Deployments", "description": "Managing deployments in Kubernetes.", "assignmentId": 20, "isActive": True, "createdAt": datetime(2023,1,20,10,0,0), "updatedAt": datetime(2023,1,20,10,0,0)},
+    {"lessonId": 21, "courseId": 11, "title": "Data Analysis Intro", "description": "Analyzing data with Pandas.", "assignmentId": 21, "isActive": True, "createdAt": datetime(2023,1,21,10,0,0), "updatedAt": datetime(2023,1,21,10,0,0)},
+    {"lessonId": 22, "courseId": 11, "title": "Data Visualization", "description": "Creating charts with matplotlib.", "assignmentId": 22, "isActive": True, "createdAt": datetime(2023,1,22,10,0,0), "updatedAt": datetime(2023,1,22,10,0,0)},
+    {"lessonId": 23, "courseId": 12, "title": "Machine Learning Intro", "description": "Supervised and unsupervised learning.", "assignmentId": 23, "isActive": True, "createdAt": datetime(2023,1,23,10,0,0), "updatedAt": datetime(2023,1,23,10,0,0)},
+    {"lessonId": 24, "courseId": 12, "title": "ML Algorithms", "description": "Regression, classification, clustering.", "assignmentId": 24, "isActive": True, "createdAt": datetime(2023,1,24,10,0,0), "updatedAt": datetime(2023,1,24,10,0,0)},
+    {"lessonId": 25, "courseId": 13, "title": "Big Data Overview", "description": "Introduction to Big Data concepts.", "assignmentId": 25, "isActive": True, "createdAt": datetime(2023,1,25,10,0,0), "updatedAt": datetime(2023,1,25,10,0,0)},
+    {"lessonId": 26, "courseId": 13, "title": "Hadoop Basics", "description": "Hadoop ecosystem and architecture.", "assignmentId": 26, "isActive": True, "createdAt": datetime(2023,1,26,10,0,0), "updatedAt": datetime(2023,1,26,10,0,0)},
+    {"lessonId": 27, "courseId": 14, "title": "NoSQL Intro", "description": "Key concepts of NoSQL databases.", "assignmentId": 27, "isActive": True, "createdAt": datetime(2023,1,27,10,0,0), "updatedAt": datetime(2023,1,27,10,0,0)},
+    {"lessonId": 28, "courseId": 14, "title": "MongoDB Basics", "description": "CRUD operations and aggregation.", "assignmentId": 28, "isActive": True, "createdAt": datetime(2023,1,28,10,0,0), "updatedAt": datetime(2023,1,28,10,0,0)},
+    {"lessonId": 29, "courseId": 15, "title": "Python Data Science", "description": "Using Python for data analysis.", "assignmentId": 29, "isActive": True, "createdAt": datetime(2023,1,29,10,0,0), "updatedAt": datetime(2023,1,29,10,0,0)},
+    {"lessonId": 30, "courseId": 15, "title": "Data Science Project", "description": "Hands-on project for data science.", "assignmentId": 30, "isActive": True, "createdAt": datetime(2023,1,30,10,0,0), "updatedAt": datetime(2023,1,30,10,0,0)},
+    {"lessonId": 31, "courseId": 1, "title": "Python Functions", "description": "Defining and using functions in Python.", "assignmentId": 31, "isActive": True, "createdAt": datetime(2023,2,1,10,0,0), "updatedAt": datetime(2023,2,1,10,0,0)},
+    {"lessonId": 32, "courseId": 2, "title": "Forms in HTML", "description": "Creating interactive forms.", "assignmentId": 32, "isActive": True, "createdAt": datetime(2023,2,2,10,0,0), "updatedAt": datetime(2023,2,2,10,0,0)},
+    {"lessonId": 33, "courseId": 3, "title": "Events in JavaScript", "description": "Handling user interactions.", "assignmentId": 33, "isActive": True, "createdAt": datetime(2023,2,3,10,0,0), "updatedAt": datetime(2023,2,3,10,0,0)},
+    {"lessonId": 34, "courseId": 4, "title": "Indexes in SQL", "description": "Creating and using indexes for performance.", "assignmentId": 34, "isActive": True, "createdAt": datetime(2023,2,4,10,0,0), "updatedAt": datetime(2023,2,4,10,0,0)},
+    {"lessonId": 35, "courseId": 5, "title": "Git Merge Conflicts", "description": "Resolving conflicts in Git.", "assignmentId": 35, "isActive": True, "createdAt": datetime(2023,2,5,10,0,0), "updatedAt": datetime(2023,2,5,10,0,0)},
+    {"lessonId": 36, "courseId": 6, "title": "Docker Networking", "description": "Managing networks in Docker.", "assignmentId": 36, "isActive": True, "createdAt": datetime(2023,2,6,10,0,0), "updatedAt": datetime(2023,2,6,10,0,0)},
+    {"lessonId": 37, "courseId": 7, "title": "OOP Design Patterns", "description": "Common patterns in software design.", "assignmentId": 37, "isActive": True, "createdAt": datetime(2023,2,7,10,0,0), "updatedAt": datetime(2023,2,7,10,0,0)},
+    {"lessonId": 38, "courseId": 8, "title": "API Testing", "description": "Testing REST APIs with Postman.", "assignmentId": 38, "isActive": True, "createdAt": datetime(2023,2,8,10,0,0), "updatedAt": datetime(2023,2,8,10,0,0)},
+    {"lessonId": 39, "courseId": 9, "title": "Cloud Security", "description": "Best practices for securing cloud services.", "assignmentId": 39, "isActive": True, "createdAt": datetime(2023,2,9,10,0,0), "updatedAt": datetime(2023,2,9,10,0,0)},
+    {"lessonId": 40, "courseId": 10, "title": "Kubernetes Services", "description": "Exposing applications with services.", "assignmentId": 40, "isActive": True, "createdAt": datetime(2023,2,10,10,0,0), "updatedAt": datetime(2023,2,10,10,0,0)}
+]
+
+
+assignments_data = [
+    {"assignmentId": 1, "lessonId": 1, "courseId": 1, "title": "Python Setup Assignment", "description": "Install Python and run your first script.", "dueDate": datetime(2023,1,5,23,59,0), "isActive": True, "createdAt": datetime(2023,1,1,10,0,0), "updatedAt": datetime(2023,1,1,10,0,0)},
+    {"assignmentId": 2, "lessonId": 2, "courseId": 1, "title": "Variables and Data Types", "description": "Create variables of different types.", "dueDate": datetime(2023,1,6,23,59,0), "isActive": True, "createdAt": datetime(2023,1,2,10,0,0), "updatedAt": datetime(2023,1,2,10,0,0)},
+    {"assignmentId": 3, "lessonId": 3, "courseId": 2, "title": "HTML Structure Assignment", "description": "Build a basic HTML page with headings and paragraphs.", "dueDate": datetime(2023,1,7,23,59,0), "isActive": True, "createdAt": datetime(2023,1,3,10,0,0), "updatedAt": datetime(2023,1,3,10,0,0)},
+    {"assignmentId": 4, "lessonId": 4, "courseId": 2, "title": "CSS Styling Assignment", "description": "Style your HTML page using CSS.", "dueDate": datetime(2023,1,8,23,59,0), "isActive": True, "createdAt": datetime(2023,1,4,10,0,0), "updatedAt": datetime(2023,1,4,10,0,0)},
+    {"assignmentId": 5, "lessonId": 5, "courseId": 3, "title": "JavaScript Functions", "description": "Write JS functions to handle basic operations.", "dueDate": datetime(2023,1,9,23,59,0), "isActive": True, "createdAt": datetime(2023,1,5,10,0,0), "updatedAt": datetime(2023,1,5,10,0,0)},
+    {"assignmentId": 6, "lessonId": 6, "courseId": 3, "title": "DOM Manipulation Task", "description": "Change HTML content using JS DOM methods.", "dueDate": datetime(2023,1,10,23,59,0), "isActive": True, "createdAt": datetime(2023,1,6,10,0,0), "updatedAt": datetime(2023,1,6,10,0,0)},
+    {"assignmentId": 7, "lessonId": 7, "courseId": 4, "title": "Basic SQL Queries", "description": "Write SELECT queries to fetch data from tables.", "dueDate": datetime(2023,1,11,23,59,0), "isActive": True, "createdAt": datetime(2023,1,7,10,0,0), "updatedAt": datetime(2023,1,7,10,0,0)},
+    {"assignmentId": 8, "lessonId": 8, "courseId": 4, "title": "SQL Joins Assignment", "description": "Use INNER, LEFT, and RIGHT joins on sample tables.", "dueDate": datetime(2023,1,12,23,59,0), "isActive": True, "createdAt": datetime(2023,1,8,10,0,0), "updatedAt": datetime(2023,1,8,10,0,0)},
+    {"assignmentId": 9, "lessonId": 9, "courseId": 5, "title": "Git Init and Commit", "description": "Initialize a repo and make your first commits.", "dueDate": datetime(2023,1,13,23,59,0), "isActive": True, "createdAt": datetime(2023,1,9,10,0,0), "updatedAt": datetime(2023,1,9,10,0,0)},
+    {"assignmentId": 10, "lessonId": 10, "courseId": 5, "title": "Git Branching Exercise", "description": "Create and merge branches in Git.", "dueDate": datetime(2023,1,14,23,59,0), "isActive": True, "createdAt": datetime(2023,1,10,10,0,0), "updatedAt": datetime(2023,1,10,10,0,0)},
+    {"assignmentId": 11, "lessonId": 11, "courseId": 6, "title": "Dockerfile Creation", "description": "Create a Dockerfile and build an image.", "dueDate": datetime(2023,1,15,23,59,0), "isActive": True, "createdAt": datetime(2023,1,11,10,0,0), "updatedAt": datetime(2023,1,11,10,0,0)},
+    {"assignmentId": 12, "lessonId": 12, "courseId": 6, "title": "Docker Compose File", "description": "Set up a multi-container application using Docker Compose.", "dueDate": datetime(2023,1,16,23,59,0), "isActive": True, "createdAt": datetime(2023,1,12,10,0,0), "updatedAt": datetime(2023,1,12,10,0,0)},
+    {"assignmentId": 13, "lessonId": 13, "courseId": 7, "title": "OOP Class Design", "description": "Design classes using inheritance and encapsulation.", "dueDate": datetime(2023,1,17,23,59,0), "isActive": True, "createdAt": datetime(2023,1,13,10,0,0), "updatedAt": datetime(2023,1,13,10,0,0)},
+    {"assignmentId": 14, "lessonId": 14, "courseId": 7, "title": "Polymorphism Exercise", "description": "Implement polymorphism in a small program.", "dueDate": datetime(2023,1,18,23,59,0), "isActive": True, "createdAt": datetime(2023,1,14,10,0,0), "updatedAt": datetime(2023,1,14,10,0,0)},
+    {"assignmentId": 15, "lessonId": 15, "courseId": 8, "title": "API REST Assignment", "description": "Build a simple REST API with GET and POST endpoints.", "dueDate": datetime(2023,1,19,23,59,0), "isActive": True, "createdAt": datetime(2023,1,15,10,0,0), "updatedAt": datetime(2023,1,15,10,0,0)}
+]
+
+
+submissions_data = [
+    {"submissionId":1,"enrollmentId":1,"assignmentId":1,"submittedAt":datetime(2023,1,5,22,0,0),"feedback":"Good work","grade":95,"createdAt":datetime(2023,1,5,22,10,0),"updatedAt":datetime(2023,1,5,22,10,0)},
+    {"submissionId":2,"enrollmentId":2,"assignmentId":1,"submittedAt":datetime(2023,1,5,21,30,0),"feedback":"Well done","grade":90,"createdAt":datetime(2023,1,5,21,35,0),"updatedAt":datetime(2023,1,5,21,35,0)},
+    {"submissionId":3,"enrollmentId":1,"assignmentId":2,"submittedAt":datetime(2023,1,6,23,0,0),"feedback":"Excellent","grade":98,"createdAt":datetime(2023,1,6,23,5,0),"updatedAt":datetime(2023,1,6,23,5,0)},
+    {"submissionId":4,"enrollmentId":3,"assignmentId":3,"submittedAt":datetime(2023,1,7,20,30,0),"feedback":"Good start","grade":88,"createdAt":datetime(2023,1,7,20,35,0),"updatedAt":datetime(2023,1,7,20,35,0)},
+    {"submissionId":5,"enrollmentId":2,"assignmentId":2,"submittedAt":datetime(2023,1,6,22,45,0),"feedback":"Nice work","grade":92,"createdAt":datetime(2023,1,6,22,50,0),"updatedAt":datetime(2023,1,6,22,50,0)},
+    {"submissionId":6,"enrollmentId":4,"assignmentId":4,"submittedAt":datetime(2023,1,8,19,0,0),"feedback":"Check styling","grade":85,"createdAt":datetime(2023,1,8,19,5,0),"updatedAt":datetime(2023,1,8,19,5,0)},
+    {"submissionId":7,"enrollmentId":1,"assignmentId":3,"submittedAt":datetime(2023,1,7,21,0,0),"feedback":"Good","grade":90,"createdAt":datetime(2023,1,7,21,5,0),"updatedAt":datetime(2023,1,7,21,5,0)},
+    {"submissionId":8,"enrollmentId":5,"assignmentId":5,"submittedAt":datetime(2023,1,9,22,15,0),"feedback":"Well implemented","grade":93,"createdAt":datetime(2023,1,9,22,20,0),"updatedAt":datetime(2023,1,9,22,20,0)},
+    {"submissionId":9,"enrollmentId":3,"assignmentId":4,"submittedAt":datetime(2023,1,8,21,30,0),"feedback":"Good CSS","grade":89,"createdAt":datetime(2023,1,8,21,35,0),"updatedAt":datetime(2023,1,8,21,35,0)},
+    {"submissionId":10,"enrollmentId":6,"assignmentId":6,"submittedAt":datetime(2023,1,10,20,45,0),"feedback":"Excellent","grade":97,"createdAt":datetime(2023,1,10,20,50,0),"updatedAt":datetime(2023,1,10,20,50,0)},
+    {"submissionId":11,"enrollmentId":4,"assignmentId":5,"submittedAt":datetime(2023,1,9,21,0,0),"feedback":"Nice logic","grade":91,"createdAt":datetime(2023,1,9,21,5,0),"updatedAt":datetime(2023,1,9,21,5,0)},
+    {"submissionId":12,"enrollmentId":2,"assignmentId":6,"submittedAt":datetime(2023,1,10,22,0,0),"feedback":"Well done","grade":94,"createdAt":datetime(2023,1,10,22,5,0),"updatedAt":datetime(2023,1,10,22,5,0)},
+    {"submissionId":13,"enrollmentId":1,"assignmentId":7,"submittedAt":datetime(2023,1,11,20,0,0),"feedback":"SQL queries fine","grade":96,"createdAt":datetime(2023,1,11,20,5,0),"updatedAt":datetime(2023,1,11,20,5,0)},
+    {"submissionId":14,"enrollmentId":5,"assignmentId":7,"submittedAt":datetime(2023,1,11,21,15,0),"feedback":"Great work","grade":95,"createdAt":datetime(2023,1,11,21,20,0),"updatedAt":datetime(2023,1,11,21,20,0)},
+    {"submissionId":15,"enrollmentId":6,"assignmentId":8,"submittedAt":datetime(2023,1,12,20,30,0),"feedback":"Correct joins","grade":92,"createdAt":datetime(2023,1,12,20,35,0),"updatedAt":datetime(2023,1,12,20,35,0)},
+    {"submissionId":16,"enrollmentId":3,"assignmentId":8,"submittedAt":datetime(2023,1,12,19,50,0),"feedback":"Well done","grade":90,"createdAt":datetime(2023,1,12,19,55,0),"updatedAt":datetime(2023,1,12,19,55,0)},
+    {"submissionId":17,"enrollmentId":4,"assignmentId":9,"submittedAt":datetime(2023,1,13,22,0,0),"feedback":"Good repo setup","grade":94,"createdAt":datetime(2023,1,13,22,5,0),"updatedAt":datetime(2023,1,13,22,5,0)},
+    {"submissionId":18,"enrollmentId":5,"assignmentId":10,"submittedAt":datetime(2023,1,14,20,30,0),"feedback":"Branches correct","grade":93,"createdAt":datetime(2023,1,14,20,35,0),"updatedAt":datetime(2023,1,14,20,35,0)},
+    {"submissionId":19,"enrollmentId":1,"assignmentId":11,"submittedAt":datetime(2023,1,15,21,0,0),"feedback":"Dockerfile ok","grade":95,"createdAt":datetime(2023,1,15,21,5,0),"updatedAt":datetime(2023,1,15,21,5,0)},
+    {"submissionId":20,"enrollmentId":6,"assignmentId":12,"submittedAt":datetime(2023,1,16,22,0,0),"feedback":"Compose setup fine","grade":96,"createdAt":datetime(2023,1,16,22,5,0),"updatedAt":datetime(2023,1,16,22,5,0)}
+]
+
+
+def _freeze(value):
+    """
+    Return a read-only copy of a document: dicts become MappingProxyType
+    and lists become tuples, recursively.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+#the sample data is never modified after this point: freezing it prevents
+#accidental changes that would make the indexes below stale, and drops the
+#spare capacity that lists keep for appends
+users_data = _freeze(users_data)
+courses_data = _freeze(courses_data)
+lessons_data = _freeze(lessons_data)
+assignments_data = _freeze(assignments_data)
+submissions_data = _freeze(submissions_data)
+
+
+#lessons by lessonId, to look up lesson details without scanning lessons_data
+_LESSON_INDEX = {lesson["lessonId"]: lesson for lesson in lessons_data}
+
+
+def _attended(lesson_id, attended_at):
+    """
+    Build the attendance entry of a finished lesson. The title and courseId
+    of the lesson are copied into it, so reading an enrollment does not need
+    a $lookup on the lesson collection; lessons_data stays the source of truth.
+    """
+    lesson = _LESSON_INDEX[lesson_id]
+    return MappingProxyType({"lessonId": lesson_id, "hasFinished": True, "attendedAt": attended_at,
+                             "lessonTitle": lesson["title"], "courseId": lesson["courseId"]})
+
+
+#attendance entries of the lessons not finished yet, one per lessonId: they
+#only differ by lesson, so every enrollment that has not finished lesson N
+#shares the same read-only entry instead of holding its own copy
+_STUB_CACHE = {}
+
+
+def _stub(lesson_id):
+    """
+    Return the shared attendance entry of a lesson that is not finished yet.
+    """
+    stub = _STUB_CACHE.get(lesson_id)
+    if stub is None:
+        lesson = _LESSON_INDEX[lesson_id]
+        stub = _STUB_CACHE[lesson_id] = MappingProxyType(
+            {"lessonId": lesson_id, "hasFinished": False, "attendedAt": _IMPORT_NOW,
+             "lessonTitle": lesson["title"], "courseId": lesson["courseId"]})
+    return stub
+
+
+#_freeze keeps the attendance tuples as they are, so the stubs stay shared
+enrollments_data = _freeze([_mk_enroll(*row) for row in _ENROLL_ROWS])
+
+
+#the lookup tables, columns and bitmaps below are only needed by callers of
+#their accessors, not by the seed files: each one is built on its first use
+#and cached, so importing the module does not pay for them
+
+
+@lru_cache(maxsize=None)
+def _enrollment_indexes():
+    """
+    Index the sample enrollments by student, by course and by enrollmentId,
+    so lookups do not scan enrollments_data.
+    """
+    by_student = defaultdict(list)
+    by_course = defaultdict(list)
+    by_enrollment_id = {}
+    for enrollment in enrollments_data:
+        by_student[enrollment["studentId"]].append(enrollment)
+        by_course[enrollment["courseId"]].append(enrollment)
+        by_enrollment_id[enrollment["enrollmentId"]] = enrollment
+    return dict(by_student), dict(by_course), by_enrollment_id
+
+
+def enrollments_of_student(student_id):
+    """Return the sample enrollments of a student (empty if none)."""
+    return _enrollment_indexes()[0].get(student_id, ())
+
+
+def enrollments_of_course(course_id):
+    """Return the sample enrollments of a course (empty if none)."""
+    return _enrollment_indexes()[1].get(course_id, ())
+
+
+def enrollment_by_id(enrollment_id):
+    """Return the sample enrollment with the given enrollmentId, or None."""
+    return _enrollment_indexes()[2].get(enrollment_id)
+
+
+@lru_cache(maxsize=None)
+def _assignment_index():
+    """Index the sample assignments by assignmentId."""
+    return {assignment["assignmentId"]: assignment for assignment in assignments_data}
+
+
+@lru_cache(maxsize=None)
+def _course_titles():
+    """Map the sample courseIds to their titles, the other side of the joins below."""
+    return {course["courseId"]: course["title"] for course in courses_data}
+
+
+def lesson_by_id(lesson_id):
+    """Return the sample lesson with the given lessonId, or None."""
+    return _LESSON_INDEX.get(lesson_id)
+
+
+def assignment_by_id(assignment_id):
+    """Return the sample assignment with the given assignmentId, or None."""
+    return _assignment_index().get(assignment_id)
+
+
+def enrollments_per_course_title():
+    """
+    Count the sample enrollments of each course, keyed by course title.
+    Joins the per-course enrollment lists with the course titles by key
+    instead of scanning courses_data for every enrollment.
+    """
+    course_titles = _course_titles()
+    return {course_titles[course_id]: len(enrollments)
+            for course_id, enrollments in _enrollment_indexes()[1].items()}
+
+
+def attended_lessons_per_course_title():
+    """
+    Count the finished attendance entries of each course, keyed by course
+    title (a lesson attended by two students counts twice).
+    """
+    course_titles = _course_titles()
+    counts = defaultdict(int)
+    for enrollment in enrollments_data:
+        for attendance in enrollment["attendance"]:
+            if attendance["hasFinished"]:
+                counts[course_titles[attendance["courseId"]]] += 1
+    return dict(counts)
+
+
+@lru_cache(maxsize=1024)
+def student_avg_progress(student_id):
+    """
+    Return the average trackProgress of a student's sample enrollments
+    (0 if the student has none).
+
+    Results are cached per student; call student_avg_progress.cache_clear()
+    if the enrollment data is ever rebuilt.
+    """
+    enrollments = enrollments_of_student(student_id)
+    return sum(enrollment["trackProgress"] for enrollment in enrollments) / max(1, len(enrollments))
+
+
+def _build_course_progress_rollup(enrollments):
+    """
+    Fold the enrollments into one progress summary per course.
+
+    Each summary counts the enrollments per completionStatus and keeps the
+    sum and average of trackProgress, so per-course progress reports read
+    one small document instead of scanning every enrollment.
+    """
+    totals = defaultdict(lambda: {"completed": 0, "in_progress": 0, "not_started": 0,
+                                  "enrollments": 0, "progressSum": 0})
+    for enrollment in enrollments:
+        course_totals = totals[enrollment["courseId"]]
+        course_totals[enrollment["completionStatus"]] += 1
+        course_totals["enrollments"] += 1
+        course_totals["progressSum"] += enrollment["trackProgress"]
+
+    return [
+        {"courseId": course_id, **course_totals,
+         "avgProgress": course_totals["progressSum"] / course_totals["enrollments"]}
+        for course_id, course_totals in sorted(totals.items())
+    ]
+
+
+#materialized per-course progress, inserted into the course_progress collection
+course_progress_rollup = _freeze(_build_course_progress_rollup(enrollments_data))
+
+
+#one document per (enrollment, lesson) attendance entry, inserted into the
+#attendance collection where attendance changes are recorded
+attendance_data = _freeze([
+    {"enrollmentId": enrollment["enrollmentId"], **attendance}
+    for enrollment in enrollments_data
+    for attendance in enrollment["attendance"]
+])
+
+#the enrollments as inserted into the enrollment collection: their
+#attendance lives in the attendance collection only, so it is not stored
+#twice (enrollments_data keeps it in memory for the lookups above)
+enrollment_documents = _freeze([
+    {key: value for key, value in enrollment.items() if key != "attendance"}
+    for enrollment in enrollments_data
+])
+
+
+_STATUS_CODE = {"not_started": 0, "in_progress": 1, "completed": 2}
+
+
+@lru_cache(maxsize=None)
+def enrollment_columns():
+    """
+    Return a columnar view of the numeric enrollment fields: one compact
+    typed array per field instead of one dict per row, for scans and
+    reductions over a column.
+    """
+    return {
+        field: array(typecode, (enrollment[field] for enrollment in enrollments_data))
+        for field, typecode in [("enrollmentId", "i"), ("courseId", "i"), ("studentId", "i"), ("trackProgress", "B")]
+    }
+
+
+@lru_cache(maxsize=None)
+def completion_status_codes():
+    """Return the completionStatus of the sample enrollments as codes (see _STATUS_CODE)."""
+    return array("B", (_STATUS_CODE[enrollment["completionStatus"]] for enrollment in enrollments_data))
+
+
+def _bitmap(flags):
+    """Pack booleans into an int bitmap: bit i is set when flag i is true."""
+    bits = 0
+    for index, flag in enumerate(flags):
+        if flag:
+            bits |= 1 << index
+    return bits
+
+
+#one bitmap per flag/status over the rows of enrollments_data, so filters can
+#be combined with a single bitwise operation, e.g. active and in progress:
+#    enrollments_from_bitmap(is_active_bits() & status_bits()["in_progress"])
+@lru_cache(maxsize=None)
+def is_active_bits():
+    """Return the bitmap of the active sample enrollments."""
+    return _bitmap(enrollment["isActive"] for enrollment in enrollments_data)
+
+
+@lru_cache(maxsize=None)
+def status_bits():
+    """Return one bitmap of the sample enrollments per completionStatus."""
+    status_codes = completion_status_codes()
+    return {
+        status: _bitmap(code == status_code for status_code in status_codes)
+        for status, code in _STATUS_CODE.items()
+    }
+
+
+def enrollments_from_bitmap(bits):
+    """Return the sample enrollments whose bit is set in the bitmap."""
+    return [enrollment for index, enrollment in enumerate(enrollments_data) if bits >> index & 1]
+
+
+def completion_status_counts():
+    """Return the number of sample enrollments per completionStatus."""
+    status_codes = completion_status_codes()
+    return {status: status_codes.count(code) for status, code in _STATUS_CODE.items()}
+
+
+def mean_track_progress():
+    """Return the average trackProgress over the sample enrollments."""
+    progress = enrollment_columns()["trackProgress"]
+    return sum(progress) / len(progress) if progress else 0
+
+
+#collection name -> sample data list loaded into it
+SEED_COLLECTIONS = {
+    "user": "users_data",
+    "course": "courses_data",
+    "enrollment": "enrollment_documents",
+    "lesson": "lessons_data",
+    "assignment": "assignments_data",
+    "submission": "submissions_data",
+    "course_progress": "course_progress_rollup",
+    "attendance": "attendance_data",
+}
+
+
+def build_seed_files(directory):
+    """
+    Write each sample data list to 'eduhub_db.<collection>.bson' in the
+    given directory (one encoded document after another, as mongodump does).
+    """
+    if not bson.has_c():
+        print("Warning: bson C extension not available, encoding with the pure Python encoder")
+    for collection_name, data_name in SEED_COLLECTIONS.items():
+        documents = globals()[data_name]
+        file_path = Path(directory) / f"eduhub_db.{collection_name}.bson"
+        file_path.write_bytes(b"".join(bson.encode(document) for document in documents))
+        print(f"Wrote {len(documents)} documents to {file_path}")
+
+
+if __name__ == "__main__":
+    build_seed_files(Path(__file__).resolve().parent.parent / "data")